@@ -1,16 +1,17 @@
 #!/usr/bin/env python3
 """Generate HTML dashboard for GitHub Pages."""
 
-import html
+import gzip
 import json
 import re
+import unicodedata
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from urllib.parse import quote
 
-from models import DB_PATH
-from utils import is_great_fit
-import sqlite3
+from models import get_all_jobs, load_company_info
+from utils import detect_work_type, is_great_fit
 
 def clean_description(text: str, max_len: int = 3000) -> str:
     if not text:
@@ -20,12 +21,211 @@ def clean_description(text: str, max_len: int = 3000) -> str:
     return text[:max_len]
 
 
-COMPANIES_FILE = Path(__file__).parent / "data" / "companies.json"
 WORK_HISTORY_FILE = Path(__file__).parent / "data" / "master_work_history.json"
 RESUME_TEMPLATE_FILE = Path(__file__).parent / "data" / "my_resume.md"
 OUTPUT_FILE = Path(__file__).parent / "docs" / "index.html"
 COMPANIES_OUTPUT_FILE = Path(__file__).parent / "docs" / "companies.html"
 RESUME_OUTPUT_FILE = Path(__file__).parent / "docs" / "resume.html"
+DASHBOARD_MAX_JOBS = 500  # most recent jobs shown; keeps the page size bounded
+
+
+# Stylesheets are written to docs/ (see write_stylesheets) so browsers can cache them
+# across the daily page rebuilds. Rules shared by every page live in style.css.
+BASE_CSS = """\
+* { box-sizing: border-box; }
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 20px;
+    background: #f5f5f5;
+}
+h1 { color: #333; }
+.nav { margin-bottom: 20px; }
+.nav a {
+    display: inline-block;
+    padding: 8px 16px;
+    background: white;
+    border-radius: 6px;
+    text-decoration: none;
+    color: #0066cc;
+    font-weight: 500;
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+    margin-right: 8px;
+}
+.nav a:hover { background: #f0f0f0; }
+.nav a.active { background: #0066cc; color: white; }
+.updated { color: #666; font-size: 14px; margin-bottom: 20px; }
+"""
+
+JOBS_CSS = """\
+.filters {
+    background: white;
+    padding: 20px;
+    border-radius: 8px;
+    margin-bottom: 20px;
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+}
+.filter-row {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 15px;
+    align-items: center;
+    margin-bottom: 15px;
+}
+.filter-row:last-child { margin-bottom: 0; }
+.filter-group {
+    display: flex;
+    align-items: center;
+    gap: 8px;
+}
+.filter-group label {
+    font-weight: 500;
+    color: #555;
+    white-space: nowrap;
+}
+.filter-group select, .filter-group input[type="text"] {
+    padding: 8px 12px;
+    border: 1px solid #ddd;
+    border-radius: 6px;
+    font-size: 14px;
+    background: white;
+}
+.filter-group select { min-width: 150px; }
+.search-input {
+    flex: 1;
+    min-width: 200px;
+    max-width: 400px;
+}
+.checkbox-group {
+    display: flex;
+    align-items: center;
+    gap: 5px;
+}
+.checkbox-group input { margin: 0; }
+.results-count {
+    color: #666;
+    font-size: 14px;
+    margin-left: auto;
+}
+.job-card {
+    background: white;
+    padding: 20px;
+    border-radius: 8px;
+    margin-bottom: 15px;
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+}
+.job-card h3 { margin: 0 0 10px 0; }
+.job-card h3 a { color: #0066cc; text-decoration: none; }
+.job-card h3 a:hover { text-decoration: underline; }
+.company { font-weight: 600; color: #333; }
+.meta { color: #666; font-size: 14px; margin: 5px 0; }
+.tags { margin-top: 10px; }
+.tag {
+    display: inline-block;
+    padding: 3px 10px;
+    border-radius: 12px;
+    font-size: 12px;
+    margin-right: 5px;
+}
+.tag-visa { background: #d4edda; color: #155724; }
+.tag-maybe { background: #fff3cd; color: #856404; }
+.tag-likely { background: #cce5ff; color: #004085; }
+.tag-unknown { background: #e9ecef; color: #495057; }
+.tag-remote { background: #e7f3ff; color: #0056b3; }
+.tag-hybrid { background: #fff3cd; color: #856404; }
+.tag-onsite { background: #f0f0f0; color: #555; }
+.tag-ethics-good { background: #d4edda; color: #155724; }
+.tag-ethics-neutral { background: #e9ecef; color: #495057; }
+.tag-ethics-kinda_evil { background: #f8d7da; color: #721c24; }
+.stats {
+    display: flex;
+    gap: 20px;
+    margin-bottom: 20px;
+    flex-wrap: wrap;
+}
+.stat {
+    background: white;
+    padding: 15px 25px;
+    border-radius: 8px;
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+}
+.stat-number { font-size: 32px; font-weight: bold; color: #0066cc; }
+.stat-label { color: #666; font-size: 14px; }
+.new-badge {
+    background: #dc3545;
+    color: white;
+    padding: 2px 8px;
+    border-radius: 10px;
+    font-size: 11px;
+    margin-left: 8px;
+}
+.greatfit-badge {
+    background: #28a745;
+    color: white;
+    padding: 2px 8px;
+    border-radius: 10px;
+    font-size: 11px;
+    margin-left: 8px;
+}
+.btn-resume {
+    display: inline-block;
+    margin-top: 10px;
+    padding: 4px 12px;
+    background: #f0f4ff;
+    border: 1px solid #c0d0f0;
+    border-radius: 6px;
+    color: #0066cc;
+    font-size: 13px;
+    text-decoration: none;
+    cursor: pointer;
+}
+.btn-resume:hover { background: #dde8ff; }
+.manual-section {
+    margin-top: 40px;
+    padding-top: 20px;
+    border-top: 2px solid #ddd;
+}
+.manual-section h2 {
+    color: #666;
+    font-size: 18px;
+    margin-bottom: 15px;
+}
+.manual-sites {
+    display: grid;
+    grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
+    gap: 15px;
+}
+.manual-site {
+    background: white;
+    padding: 15px 20px;
+    border-radius: 8px;
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+    border-left: 4px solid #6c757d;
+}
+.manual-site h3 {
+    margin: 0 0 8px 0;
+    font-size: 16px;
+}
+.manual-site h3 a {
+    color: #0066cc;
+    text-decoration: none;
+}
+.manual-site h3 a:hover {
+    text-decoration: underline;
+}
+.manual-site p {
+    margin: 0;
+    color: #666;
+    font-size: 13px;
+}
+@media (max-width: 600px) {
+    .filter-row { flex-direction: column; align-items: stretch; }
+    .filter-group { width: 100%; }
+    .filter-group select, .search-input { width: 100%; max-width: none; }
+    .results-count { margin-left: 0; margin-top: 10px; }
+}
+"""
 
 HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
@@ -33,199 +233,8 @@ HTML_TEMPLATE = """<!DOCTYPE html>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Barcelona DS Jobs</title>
-    <style>
-        * {{ box-sizing: border-box; }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }}
-        h1 {{ color: #333; }}
-        .nav {{ margin-bottom: 20px; }}
-        .nav a {{
-            display: inline-block;
-            padding: 8px 16px;
-            background: white;
-            border-radius: 6px;
-            text-decoration: none;
-            color: #0066cc;
-            font-weight: 500;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-            margin-right: 8px;
-        }}
-        .nav a:hover {{ background: #f0f0f0; }}
-        .nav a.active {{ background: #0066cc; color: white; }}
-        .updated {{ color: #666; font-size: 14px; margin-bottom: 20px; }}
-        .filters {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }}
-        .filter-row {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 15px;
-            align-items: center;
-            margin-bottom: 15px;
-        }}
-        .filter-row:last-child {{ margin-bottom: 0; }}
-        .filter-group {{
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }}
-        .filter-group label {{
-            font-weight: 500;
-            color: #555;
-            white-space: nowrap;
-        }}
-        .filter-group select, .filter-group input[type="text"] {{
-            padding: 8px 12px;
-            border: 1px solid #ddd;
-            border-radius: 6px;
-            font-size: 14px;
-            background: white;
-        }}
-        .filter-group select {{ min-width: 150px; }}
-        .search-input {{
-            flex: 1;
-            min-width: 200px;
-            max-width: 400px;
-        }}
-        .checkbox-group {{
-            display: flex;
-            align-items: center;
-            gap: 5px;
-        }}
-        .checkbox-group input {{ margin: 0; }}
-        .results-count {{
-            color: #666;
-            font-size: 14px;
-            margin-left: auto;
-        }}
-        .job-card {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 15px;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }}
-        .job-card.hidden {{ display: none; }}
-        .job-card h3 {{ margin: 0 0 10px 0; }}
-        .job-card h3 a {{ color: #0066cc; text-decoration: none; }}
-        .job-card h3 a:hover {{ text-decoration: underline; }}
-        .company {{ font-weight: 600; color: #333; }}
-        .meta {{ color: #666; font-size: 14px; margin: 5px 0; }}
-        .tags {{ margin-top: 10px; }}
-        .tag {{
-            display: inline-block;
-            padding: 3px 10px;
-            border-radius: 12px;
-            font-size: 12px;
-            margin-right: 5px;
-        }}
-        .tag-visa {{ background: #d4edda; color: #155724; }}
-        .tag-maybe {{ background: #fff3cd; color: #856404; }}
-        .tag-likely {{ background: #cce5ff; color: #004085; }}
-        .tag-unknown {{ background: #e9ecef; color: #495057; }}
-        .tag-remote {{ background: #e7f3ff; color: #0056b3; }}
-        .tag-hybrid {{ background: #fff3cd; color: #856404; }}
-        .tag-onsite {{ background: #f0f0f0; color: #555; }}
-        .tag-ethics-good {{ background: #d4edda; color: #155724; }}
-        .tag-ethics-neutral {{ background: #e9ecef; color: #495057; }}
-        .tag-ethics-kinda_evil {{ background: #f8d7da; color: #721c24; }}
-        .stats {{
-            display: flex;
-            gap: 20px;
-            margin-bottom: 20px;
-            flex-wrap: wrap;
-        }}
-        .stat {{
-            background: white;
-            padding: 15px 25px;
-            border-radius: 8px;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        }}
-        .stat-number {{ font-size: 32px; font-weight: bold; color: #0066cc; }}
-        .stat-label {{ color: #666; font-size: 14px; }}
-        .new-badge {{
-            background: #dc3545;
-            color: white;
-            padding: 2px 8px;
-            border-radius: 10px;
-            font-size: 11px;
-            margin-left: 8px;
-        }}
-        .greatfit-badge {{
-            background: #28a745;
-            color: white;
-            padding: 2px 8px;
-            border-radius: 10px;
-            font-size: 11px;
-            margin-left: 8px;
-        }}
-        .btn-resume {{
-            display: inline-block;
-            margin-top: 10px;
-            padding: 4px 12px;
-            background: #f0f4ff;
-            border: 1px solid #c0d0f0;
-            border-radius: 6px;
-            color: #0066cc;
-            font-size: 13px;
-            text-decoration: none;
-            cursor: pointer;
-        }}
-        .btn-resume:hover {{ background: #dde8ff; }}
-        .manual-section {{
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 2px solid #ddd;
-        }}
-        .manual-section h2 {{
-            color: #666;
-            font-size: 18px;
-            margin-bottom: 15px;
-        }}
-        .manual-sites {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
-            gap: 15px;
-        }}
-        .manual-site {{
-            background: white;
-            padding: 15px 20px;
-            border-radius: 8px;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-            border-left: 4px solid #6c757d;
-        }}
-        .manual-site h3 {{
-            margin: 0 0 8px 0;
-            font-size: 16px;
-        }}
-        .manual-site h3 a {{
-            color: #0066cc;
-            text-decoration: none;
-        }}
-        .manual-site h3 a:hover {{
-            text-decoration: underline;
-        }}
-        .manual-site p {{
-            margin: 0;
-            color: #666;
-            font-size: 13px;
-        }}
-        @media (max-width: 600px) {{
-            .filter-row {{ flex-direction: column; align-items: stretch; }}
-            .filter-group {{ width: 100%; }}
-            .filter-group select, .search-input {{ width: 100%; max-width: none; }}
-            .results-count {{ margin-left: 0; margin-top: 10px; }}
-        }}
-    </style>
+    <link rel="stylesheet" href="style.css">
+    <link rel="stylesheet" href="jobs.css">
 </head>
 <body>
     <h1>Barcelona Data Science Jobs</h1>
@@ -297,9 +306,13 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         </div>
     </div>
 
-    <div id="jobs">
-        {jobs_html}
-    </div>
+    <script>
+        const SORT_INDEX = {sort_index};
+        const JOBS = {jobs_json};
+    </script>
+    <div id="jobs"></div>
+    <div id="jobs-sentinel"></div>
+    <noscript><p>Enable JavaScript to see the job list.</p></noscript>
 
     <div class="manual-section">
         <h2>Non-Automated Sites (Check Manually)</h2>
@@ -324,22 +337,65 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         const sortSelect = document.getElementById('sort-by');
         const visibleCount = document.getElementById('visible-count');
         const jobsContainer = document.getElementById('jobs');
+        const sentinel = document.getElementById('jobs-sentinel');
+
+        const BATCH_SIZE = 50;  // cards appended each time the sentinel scrolls into view
+        const VISA_TAGS = {{
+            yes: ['visa', 'Yes (job posting)'],
+            maybe: ['maybe', 'Maybe (relocation)'],
+            likely: ['likely', 'Likely (company)'],
+            unknown: ['unknown', 'Unknown'],
+        }};
+        const ETHICS_LABELS = {{good: 'Good', neutral: 'Neutral', kinda_evil: 'Caution'}};
+        const WORKTYPE_LABELS = {{remote: 'Remote', hybrid: 'Hybrid', onsite: 'In-person'}};
+
+        // Text fields arrive HTML-escaped; decode and lowercase them once for search,
+        // so terms like "AT&T" or "L'Oréal" match the text as displayed
+        const HTML_ENTITIES = {{'&amp;': '&', '&lt;': '<', '&gt;': '>', '&quot;': '"', '&#x27;': "'"}};
+        const unescapeHtml = s => s.replace(/&(?:amp|lt|gt|quot|#x27);/g, entity => HTML_ENTITIES[entity]);
+        JOBS.forEach(job => {{
+            job.ts = unescapeHtml(job.t).toLowerCase();
+            job.ns = unescapeHtml(job.n).toLowerCase();
+        }});
 
-        // Apply URL params on load
-        const urlParams = new URLSearchParams(window.location.search);
-        const paramCompany = urlParams.get('company');
-        if (paramCompany) {{
-            companySelect.value = paramCompany;
-            visaCheckbox.checked = false;
-            filterJobs();
+        let visibleJobs = [];  // positions into JOBS that pass the filters, in sort order
+        let rendered = 0;
+
+        // Without IntersectionObserver every visible card is rendered at once
+        const observer = 'IntersectionObserver' in window
+            ? new IntersectionObserver(entries => {{
+                if (entries[0].isIntersecting && rendered < visibleJobs.length) renderMore();
+            }}, {{rootMargin: '600px'}})
+            : null;
+
+        function renderCard(i) {{
+            const job = JOBS[i];
+            const [visaClass, visaLabel] = VISA_TAGS[job.v];
+            return `<div class="job-card" data-idx="${{i}}">
+    <h3><a href="${{job.u}}" target="_blank">${{job.t}}</a>${{job.N ? '<span class="new-badge">NEW</span>' : ''}}${{job.g ? '<span class="greatfit-badge">GREAT FIT</span>' : ''}}</h3>
+    <div class="company">${{job.n}}</div>
+    <div class="meta">${{job.l}} · Posted: ${{job.p}} · Added: ${{job.s}}</div>
+    <div class="tags">
+        <span class="tag tag-${{job.w}}">${{WORKTYPE_LABELS[job.w]}}</span>
+        <span class="tag tag-${{visaClass}}">${{visaLabel}}</span>
+        <span class="tag tag-ethics-${{job.e}}">${{ETHICS_LABELS[job.e] || job.e}}</span>
+    </div>
+    <button class="btn-resume" onclick="openResumeBuilder(this)">Generate Resume</button>
+</div>`;
         }}
 
-        searchInput.addEventListener('input', filterJobs);
-        visaCheckbox.addEventListener('change', filterJobs);
-        greatfitCheckbox.addEventListener('change', filterJobs);
-        worktypeSelect.addEventListener('change', filterJobs);
-        companySelect.addEventListener('change', filterJobs);
-        sortSelect.addEventListener('change', sortJobs);
+        function renderMore() {{
+            const end = observer ? Math.min(rendered + BATCH_SIZE, visibleJobs.length) : visibleJobs.length;
+            let html = '';
+            for (let k = rendered; k < end; k++) html += renderCard(visibleJobs[k]);
+            jobsContainer.insertAdjacentHTML('beforeend', html);
+            rendered = end;
+            if (observer) {{
+                // Re-observe so the callback fires again if the sentinel is still in view
+                observer.unobserve(sentinel);
+                observer.observe(sentinel);
+            }}
+        }}
 
         function filterJobs() {{
             const searchTerm = searchInput.value.toLowerCase().trim();
@@ -347,254 +403,285 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             const greatfitOnly = greatfitCheckbox.checked;
             const worktype = worktypeSelect.value;
             const company = companySelect.value;
-
-            let count = 0;
-            document.querySelectorAll('.job-card').forEach(card => {{
-                const hasVisa = card.dataset.visa !== 'unknown';
-                const isGreatFit = card.dataset.greatfit === 'true';
-                const cardWorktype = card.dataset.worktype;
-                const cardCompany = card.dataset.company;
-                const cardTitle = card.dataset.title.toLowerCase();
-                const cardCompanyName = card.dataset.companyname.toLowerCase();
-
-                let show = true;
-
-                // Visa filter
-                if (visaOnly && !hasVisa) show = false;
-
-                // Great fit filter
-                if (greatfitOnly && !isGreatFit) show = false;
-
-                // Work type filter
-                if (worktype !== 'all' && cardWorktype !== worktype) show = false;
-
-                // Company filter
-                if (company !== 'all' && cardCompany !== company) show = false;
-
-                // Search filter
-                if (searchTerm && !cardTitle.includes(searchTerm) && !cardCompanyName.includes(searchTerm)) {{
-                    show = false;
-                }}
-
-                card.classList.toggle('hidden', !show);
-                if (show) count++;
+            // Orderings are precomputed at generation time, so no comparisons run here
+            const order = SORT_INDEX[sortSelect.value] || SORT_INDEX['scraped-desc'];
+
+            visibleJobs = order.filter(i => {{
+                const job = JOBS[i];
+                if (visaOnly && job.v === 'unknown') return false;
+                if (greatfitOnly && !job.g) return false;
+                if (worktype !== 'all' && job.w !== worktype) return false;
+                if (company !== 'all' && job.c !== company) return false;
+                if (searchTerm && !job.ts.includes(searchTerm) && !job.ns.includes(searchTerm)) return false;
+                return true;
             }});
 
-            visibleCount.textContent = count;
-        }}
-
-        function sortJobs() {{
-            const sortBy = sortSelect.value;
-            const cards = Array.from(document.querySelectorAll('.job-card'));
-
-            cards.sort((a, b) => {{
-                if (sortBy === 'scraped-desc') {{
-                    return b.dataset.scraped.localeCompare(a.dataset.scraped);
-                }} else if (sortBy === 'scraped-asc') {{
-                    return a.dataset.scraped.localeCompare(b.dataset.scraped);
-                }} else if (sortBy === 'posted-desc') {{
-                    return b.dataset.posted.localeCompare(a.dataset.posted);
-                }} else if (sortBy === 'posted-asc') {{
-                    return a.dataset.posted.localeCompare(b.dataset.posted);
-                }} else if (sortBy === 'company-asc') {{
-                    return a.dataset.companyname.localeCompare(b.dataset.companyname);
-                }}
-                return 0;
-            }});
-
-            cards.forEach(card => jobsContainer.appendChild(card));
-            filterJobs();
+            visibleCount.textContent = visibleJobs.length;
+            jobsContainer.innerHTML = '';
+            rendered = 0;
+            renderMore();
         }}
 
         function openResumeBuilder(btn) {{
             const card = btn.closest('.job-card');
             const title = card.querySelector('h3 a').textContent;
             const company = card.querySelector('.company').textContent;
-            const description = card.dataset.description || '';
+            const description = JOBS[card.dataset.idx].d;
             sessionStorage.setItem('resumeJob', JSON.stringify({{title, company, description}}));
             window.open('resume.html', '_blank');
         }}
+
+        // Apply URL params on load
+        const urlParams = new URLSearchParams(window.location.search);
+        const paramCompany = urlParams.get('company');
+        if (paramCompany) {{
+            companySelect.value = paramCompany;
+            visaCheckbox.checked = false;
+        }}
+
+        searchInput.addEventListener('input', filterJobs);
+        visaCheckbox.addEventListener('change', filterJobs);
+        greatfitCheckbox.addEventListener('change', filterJobs);
+        worktypeSelect.addEventListener('change', filterJobs);
+        companySelect.addEventListener('change', filterJobs);
+        sortSelect.addEventListener('change', filterJobs);
+
+        filterJobs();
     </script>
 </body>
 </html>
 """
 
-JOB_CARD_TEMPLATE = """
-<div class="job-card" data-visa="{visa_data}" data-ethics="{ethics}" data-worktype="{worktype}" data-company="{company_id}" data-title="{title_lower}" data-companyname="{company_lower}" data-posted="{posted_sort}" data-scraped="{scraped_sort}" data-greatfit="{greatfit}" data-description="{description_attr}">
-    <h3><a href="{url}" target="_blank">{title}</a>{new_badge}{greatfit_badge}</h3>
-    <div class="company">{company}</div>
-    <div class="meta">{location} · Posted: {posted_date} · Added: {scraped_date}</div>
-    <div class="tags">
-        <span class="tag tag-{worktype}">{worktype_label}</span>
-        <span class="tag tag-{visa_class}">{visa_status}</span>
-        <span class="tag tag-ethics-{ethics}">{ethics_label}</span>
-    </div>
-    <button class="btn-resume" onclick="openResumeBuilder(this)">Generate Resume</button>
-</div>
-"""
+# Same replacements as html.escape(quote=True), done in one str.translate pass
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
 
+_ETHICS_LABEL = {'good': 'Good', 'neutral': 'Neutral', 'kinda_evil': 'Caution'}
 
-def load_company_info() -> dict:
-    if not COMPANIES_FILE.exists():
-        return {}
-    with open(COMPANIES_FILE) as f:
-        data = json.load(f)
-    return {c['id']: c for c in data.get('companies', [])}
-
-
-def get_all_jobs() -> list[dict]:
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-    cursor.execute("""
-        SELECT * FROM jobs
-        WHERE is_barcelona = 1 AND is_data_role = 1
-        ORDER BY scraped_date DESC
-    """)
-    rows = cursor.fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
-
-
-def detect_work_type(location: str, description: str) -> tuple[str, str]:
-    """Detect work type from location and description. Returns (type_id, label)."""
-    location = (location or '').lower()
-    description = (description or '').lower()
-    text = location + ' ' + description
-
-    # Check for remote indicators
-    remote_keywords = ['remote', 'work from home', 'wfh', 'fully remote', '100% remote']
-    hybrid_keywords = ['hybrid', 'flexible', '2 days', '3 days', 'days in office', 'days per week']
-
-    if any(kw in text for kw in remote_keywords):
-        # Check if it's actually hybrid
-        if any(kw in text for kw in hybrid_keywords):
-            return 'hybrid', 'Hybrid'
-        return 'remote', 'Remote'
-    elif any(kw in text for kw in hybrid_keywords):
-        return 'hybrid', 'Hybrid'
-    else:
-        return 'onsite', 'In-person'
+# Visa status indexed by (mentions_visa << 2) | (mentions_relocation << 1) | company_sponsors;
+# the job posting outranks relocation, which outranks the company's sponsorship record
+_VISA_DATA = ('unknown', 'likely', 'maybe', 'maybe', 'yes', 'yes', 'yes', 'yes')
 
+# Split once around the job data so the JSON can be written straight to the output file
+HTML_HEADER_TEMPLATE, _HTML_FOOTER_TEMPLATE = HTML_TEMPLATE.split('{jobs_json}')
+HTML_FOOTER = _HTML_FOOTER_TEMPLATE.format()  # no fields; just unescapes {{ }}
 
-def generate_html():
-    jobs = get_all_jobs()
-    companies = load_company_info()
 
-    def is_barcelona(job):
-        location = (job['location'] or '').lower()
-        return 'barcelona' in location or 'spain' in location or 'bcn' in location
+def write_gzip_sidecar(path: Path) -> None:
+    """Write a precompressed path.gz next to a generated page.
 
-    barcelona_jobs = [j for j in jobs if is_barcelona(j)]
-    today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-    new_today = sum(1 for j in barcelona_jobs if j['scraped_date'][:10] == today)
-    unique_companies = len(set(j['company_id'] for j in barcelona_jobs))
+    mtime=0 keeps the output deterministic so unchanged pages don't show up
+    as modified in the daily commit.
+    """
+    gz_path = path.with_name(path.name + '.gz')
+    gz_path.write_bytes(gzip.compress(path.read_bytes(), compresslevel=9, mtime=0))
 
-    # Build company options for dropdown (only companies with jobs)
-    companies_with_jobs = {}
-    for job in barcelona_jobs:
-        cid = job['company_id']
-        if cid not in companies_with_jobs:
-            company_info = companies.get(cid, {})
-            companies_with_jobs[cid] = company_info.get('name', cid)
 
-    company_options = '\n'.join(
-        f'<option value="{cid}">{name}</option>'
-        for cid, name in sorted(companies_with_jobs.items(), key=lambda x: x[1].lower())
-    )
+def write_stylesheets() -> None:
+    """Write the page stylesheets to docs/, touching only files whose content changed."""
+    docs_dir = OUTPUT_FILE.parent
+    docs_dir.mkdir(parents=True, exist_ok=True)
+    for name, css in (('style.css', BASE_CSS), ('jobs.css', JOBS_CSS),
+                      ('companies.css', COMPANIES_CSS), ('resume.css', RESUME_CSS)):
+        path = docs_dir / name
+        # Leaving unchanged files alone keeps their mtime/ETag stable for browser caches
+        if not path.exists() or path.read_text(encoding='utf-8') != css:
+            path.write_text(css, encoding='utf-8')
 
-    jobs_html = []
-    for job in jobs:
-        # Filter to Barcelona-only jobs
-        location = (job['location'] or '').lower()
-        if 'barcelona' not in location and 'spain' not in location and 'bcn' not in location:
-            continue
-
-        company_info = companies.get(job['company_id'], {})
-        company_sponsors = company_info.get('known_visa_sponsor', False)
-        company_name = company_info.get('name', job['company_id'])
-
-        # Determine visa status
-        if job['mentions_visa']:
-            visa_status = 'Yes (job posting)'
-            visa_class = 'visa'
-            visa_data = 'yes'
-        elif job['mentions_relocation']:
-            visa_status = 'Maybe (relocation)'
-            visa_class = 'maybe'
-            visa_data = 'maybe'
-        elif company_sponsors:
-            visa_status = 'Likely (company)'
-            visa_class = 'likely'
-            visa_data = 'likely'
-        else:
-            visa_status = 'Unknown'
-            visa_class = 'unknown'
-            visa_data = 'unknown'
 
-        ethics = company_info.get('ethics_rating', 'neutral')
-        ethics_label = {'good': 'Good', 'neutral': 'Neutral', 'kinda_evil': 'Caution'}.get(ethics, ethics)
+def _company_sort_key(name: str) -> tuple[str, str]:
+    """
+    Sort key approximating the browser's localeCompare on the plain company name:
+    letters compare without accents or case first, and those only break ties.
+    """
+    folded = name.casefold()
+    return ''.join(c for c in unicodedata.normalize('NFKD', folded) if not unicodedata.combining(c)), folded
+
+
+def build_sort_index(sort_keys: list[tuple[str, str, tuple[str, str]]]) -> dict[str, list[int]]:
+    """
+    Precompute card orderings for each sort-by option as lists of card positions.
+    sort_keys holds (scraped_sort, posted_sort, company_sort_key) for each card.
+    """
+    positions = range(len(sort_keys))
+    return {
+        'scraped-desc': sorted(positions, key=lambda i: sort_keys[i][0], reverse=True),
+        'scraped-asc': sorted(positions, key=lambda i: sort_keys[i][0]),
+        'posted-desc': sorted(positions, key=lambda i: sort_keys[i][1], reverse=True),
+        'posted-asc': sorted(positions, key=lambda i: sort_keys[i][1]),
+        'company-asc': sorted(positions, key=lambda i: sort_keys[i][2]),
+    }
+
+
+def generate_html():
+    jobs = get_all_jobs()
+    companies = load_company_info()
+    # (name, known_visa_sponsor, ethics_rating) per company, resolved once
+    company_index = {
+        cid: (info.get('name', cid), info.get('known_visa_sponsor', False), info.get('ethics_rating', 'neutral'))
+        for cid, info in companies.items()
+    }
+
+    # Fixed ASCII formats, so build them directly rather than via strftime
+    now = datetime.now(timezone.utc)
+    today = f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+    updated = f"{today} {now.hour:02d}:{now.minute:02d} UTC"
+    new_today = 0
+    company_names = {}  # companies with at least one job -> display name
+    company_job_counts: dict[str, int] = {}
+    company_greatfit_counts: dict[str, int] = {}
+
+    jobs_data = []  # one compact dict per card; short keys keep the embedded JSON small
+    sort_keys = []  # (scraped_sort, posted_sort, company_sort_key) per card, in render order
+    for (title, url, cid, location, posted, scraped,
+         mentions_visa, mentions_relocation, description) in islice(jobs, DASHBOARD_MAX_JOBS):
+        company_name, company_sponsors, ethics = company_index.get(cid) or (cid, False, 'neutral')
+
+        company_names.setdefault(cid, company_name)
+        company_job_counts[cid] = company_job_counts.get(cid, 0) + 1
+
+        # Determine visa status; the browser maps it to the tag label and class
+        visa_data = _VISA_DATA[(bool(mentions_visa) << 2) | (bool(mentions_relocation) << 1)
+                               | bool(company_sponsors)]
 
         # Detect work type
-        worktype, worktype_label = detect_work_type(job['location'], job.get('description_full'))
+        worktype, _ = detect_work_type(location, description)
 
-        is_new = job['scraped_date'][:10] == today
-        new_badge = '<span class="new-badge">NEW</span>' if is_new else ''
+        is_new = scraped.startswith(today)
+        new_today += is_new
 
         # Format dates for sorting (use 0000-00-00 for unknown to sort last)
-        posted_sort = job['posted_date'] or '0000-00-00'
-        scraped_sort = job['scraped_date'][:10] if job['scraped_date'] else '0000-00-00'
-        scraped_display = job['scraped_date'][:10] if job['scraped_date'] else 'Unknown'
+        posted_sort = posted or '0000-00-00'
+        scraped_day = scraped[:10]
+        scraped_sort = scraped_day or '0000-00-00'
 
         # Check if great fit
-        great_fit = is_great_fit(job['job_title'], job.get('description_full') or '')
-        greatfit_badge = '<span class="greatfit-badge">GREAT FIT</span>' if great_fit else ''
-
-        description_attr = html.escape(clean_description(job.get('description_full') or ''), quote=True)
-
-        jobs_html.append(JOB_CARD_TEMPLATE.format(
-            title=job['job_title'],
-            title_lower=job['job_title'].lower(),
-            url=job['job_url'],
-            company=company_name,
-            company_id=job['company_id'],
-            company_lower=company_name.lower(),
-            description_attr=description_attr,
-            location=job['location'] or 'Barcelona',
-            posted_date=job['posted_date'] or 'Unknown',
-            posted_sort=posted_sort,
-            scraped_date=scraped_display,
-            scraped_sort=scraped_sort,
-            visa_status=visa_status,
-            visa_class=visa_class,
-            visa_data=visa_data,
-            ethics=ethics,
-            ethics_label=ethics_label,
-            worktype=worktype,
-            worktype_label=worktype_label,
-            new_badge=new_badge,
-            greatfit='true' if great_fit else 'false',
-            greatfit_badge=greatfit_badge,
-        ))
+        great_fit = is_great_fit(title, description or '')
+        if great_fit:
+            company_greatfit_counts[cid] = company_greatfit_counts.get(cid, 0) + 1
+
+        company_esc = company_name.translate(_HTML_ESCAPE_TABLE)
+        sort_keys.append((scraped_sort, posted_sort, _company_sort_key(company_name)))
+        # Fields the browser inserts as markup are escaped here; 'd' is only ever used as text
+        jobs_data.append({
+            't': title.translate(_HTML_ESCAPE_TABLE),
+            'u': url.translate(_HTML_ESCAPE_TABLE),
+            'c': cid,
+            'n': company_esc,
+            'l': (location or 'Barcelona').translate(_HTML_ESCAPE_TABLE),
+            'p': posted or 'Unknown',
+            's': scraped_day or 'Unknown',
+            'v': visa_data,
+            'e': ethics,
+            'w': worktype,
+            'g': int(great_fit),
+            'N': int(is_new),
+            'd': clean_description(description or ''),
+        })
+    job_count = len(jobs_data)
+
+    # Older jobs past the dashboard cap still count towards the companies page totals
+    for title, _, cid, *_, description in jobs:
+        company_job_counts[cid] = company_job_counts.get(cid, 0) + 1
+        if is_great_fit(title, description or ''):
+            company_greatfit_counts[cid] = company_greatfit_counts.get(cid, 0) + 1
 
-    page = HTML_TEMPLATE.format(
-        updated=datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC'),
-        total_jobs=len(jobs_html),
-        new_today=new_today,
-        companies=unique_companies,
-        company_options=company_options,
-        jobs_html='\n'.join(jobs_html),
+    company_options = '\n'.join(
+        f'<option value="{cid}">{name.translate(_HTML_ESCAPE_TABLE)}</option>'
+        for cid, name in sorted(company_names.items(), key=lambda x: x[1].lower())
     )
 
-    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    OUTPUT_FILE.write_text(page)
-    print(f"Generated {OUTPUT_FILE} with {len(jobs_html)} Barcelona jobs")
+    write_stylesheets()
+    with OUTPUT_FILE.open('w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(HTML_HEADER_TEMPLATE.format(
+            updated=updated,
+            total_jobs=job_count,
+            new_today=new_today,
+            companies=len(company_names),
+            company_options=company_options,
+            sort_index=json.dumps(build_sort_index(sort_keys), separators=(',', ':')),
+        ))
+        # '<' only occurs inside JSON strings, so \u003c keeps "</script>" out of the page
+        f.write(json.dumps(jobs_data, ensure_ascii=False, separators=(',', ':')).replace('<', '\\u003c'))
+        f.write(HTML_FOOTER)
+    write_gzip_sidecar(OUTPUT_FILE)
+    print(f"Generated {OUTPUT_FILE} with {job_count} Barcelona jobs")
 
-    generate_companies_html(jobs, companies)
+    generate_companies_html(companies, company_job_counts, company_greatfit_counts, updated)
     generate_resume_html()
 
-    return len(jobs_html), new_today
-
+    return job_count, new_today
+
+
+COMPANIES_CSS = """\
+.table-wrap {
+    background: white;
+    border-radius: 8px;
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+    overflow: auto;
+}
+table {
+    width: 100%;
+    border-collapse: collapse;
+    font-size: 14px;
+}
+thead th {
+    background: #f8f9fa;
+    padding: 12px 14px;
+    text-align: left;
+    border-bottom: 2px solid #dee2e6;
+    white-space: nowrap;
+    cursor: pointer;
+    user-select: none;
+}
+thead th:hover { background: #e9ecef; }
+thead th.sort-asc::after { content: " ▲"; font-size: 10px; }
+thead th.sort-desc::after { content: " ▼"; font-size: 10px; }
+tbody tr:nth-child(even) { background: #fafafa; }
+tbody tr:hover { background: #f0f4ff; }
+td { padding: 10px 14px; border-bottom: 1px solid #f0f0f0; vertical-align: middle; }
+td a { color: #0066cc; text-decoration: none; }
+td a:hover { text-decoration: underline; }
+.badge {
+    display: inline-block;
+    padding: 2px 8px;
+    border-radius: 10px;
+    font-size: 12px;
+    white-space: nowrap;
+}
+.badge-yes { background: #d4edda; color: #155724; }
+.badge-likely { background: #cce5ff; color: #004085; }
+.badge-no { background: #f8d7da; color: #721c24; }
+.badge-unknown { background: #e9ecef; color: #495057; }
+.badge-good { background: #d4edda; color: #155724; }
+.badge-neutral { background: #e9ecef; color: #495057; }
+.badge-kinda_evil { background: #f8d7da; color: #721c24; }
+.jobs-count {
+    font-weight: 600;
+    color: #0066cc;
+}
+.jobs-zero { color: #aaa; }
+.filters {
+    background: white;
+    padding: 15px 20px;
+    border-radius: 8px;
+    margin-bottom: 15px;
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+    display: flex;
+    gap: 15px;
+    align-items: center;
+    flex-wrap: wrap;
+}
+.filters label { font-weight: 500; color: #555; }
+.filters input[type="text"] {
+    padding: 7px 12px;
+    border: 1px solid #ddd;
+    border-radius: 6px;
+    font-size: 14px;
+    min-width: 220px;
+}
+.filters input[type="checkbox"] { margin: 0 4px 0 0; }
+.row-count { color: #666; font-size: 13px; margin-left: auto; }
+"""
 
 COMPANIES_PAGE_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
@@ -602,100 +689,8 @@ COMPANIES_PAGE_TEMPLATE = """<!DOCTYPE html>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Barcelona DS Jobs - Companies</title>
-    <style>
-        * {{ box-sizing: border-box; }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }}
-        h1 {{ color: #333; }}
-        .nav {{ margin-bottom: 20px; }}
-        .nav a {{
-            display: inline-block;
-            padding: 8px 16px;
-            background: white;
-            border-radius: 6px;
-            text-decoration: none;
-            color: #0066cc;
-            font-weight: 500;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-            margin-right: 8px;
-        }}
-        .nav a:hover {{ background: #f0f0f0; }}
-        .nav a.active {{ background: #0066cc; color: white; }}
-        .updated {{ color: #666; font-size: 14px; margin-bottom: 20px; }}
-        .table-wrap {{
-            background: white;
-            border-radius: 8px;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-            overflow: auto;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            font-size: 14px;
-        }}
-        thead th {{
-            background: #f8f9fa;
-            padding: 12px 14px;
-            text-align: left;
-            border-bottom: 2px solid #dee2e6;
-            white-space: nowrap;
-            cursor: pointer;
-            user-select: none;
-        }}
-        thead th:hover {{ background: #e9ecef; }}
-        thead th.sort-asc::after {{ content: " ▲"; font-size: 10px; }}
-        thead th.sort-desc::after {{ content: " ▼"; font-size: 10px; }}
-        tbody tr:nth-child(even) {{ background: #fafafa; }}
-        tbody tr:hover {{ background: #f0f4ff; }}
-        td {{ padding: 10px 14px; border-bottom: 1px solid #f0f0f0; vertical-align: middle; }}
-        td a {{ color: #0066cc; text-decoration: none; }}
-        td a:hover {{ text-decoration: underline; }}
-        .badge {{
-            display: inline-block;
-            padding: 2px 8px;
-            border-radius: 10px;
-            font-size: 12px;
-            white-space: nowrap;
-        }}
-        .badge-yes {{ background: #d4edda; color: #155724; }}
-        .badge-likely {{ background: #cce5ff; color: #004085; }}
-        .badge-no {{ background: #f8d7da; color: #721c24; }}
-        .badge-unknown {{ background: #e9ecef; color: #495057; }}
-        .badge-good {{ background: #d4edda; color: #155724; }}
-        .badge-neutral {{ background: #e9ecef; color: #495057; }}
-        .badge-kinda_evil {{ background: #f8d7da; color: #721c24; }}
-        .jobs-count {{
-            font-weight: 600;
-            color: #0066cc;
-        }}
-        .jobs-zero {{ color: #aaa; }}
-        .filters {{
-            background: white;
-            padding: 15px 20px;
-            border-radius: 8px;
-            margin-bottom: 15px;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-            display: flex;
-            gap: 15px;
-            align-items: center;
-            flex-wrap: wrap;
-        }}
-        .filters label {{ font-weight: 500; color: #555; }}
-        .filters input[type="text"] {{
-            padding: 7px 12px;
-            border: 1px solid #ddd;
-            border-radius: 6px;
-            font-size: 14px;
-            min-width: 220px;
-        }}
-        .filters input[type="checkbox"] {{ margin: 0 4px 0 0; }}
-        .row-count {{ color: #666; font-size: 13px; margin-left: auto; }}
-    </style>
+    <link rel="stylesheet" href="style.css">
+    <link rel="stylesheet" href="companies.css">
 </head>
 <body>
     <h1>Barcelona Data Science Jobs</h1>
@@ -810,21 +805,9 @@ COMPANY_ROW_TEMPLATE = """                <tr data-name="{name_lower}" data-indu
                 </tr>"""
 
 
-def generate_companies_html(jobs: list[dict], companies: dict):
-    """Generate the companies overview page."""
-    # Count jobs and great fits per company
-    company_job_counts: dict[str, int] = {}
-    company_greatfit_counts: dict[str, int] = {}
-
-    for job in jobs:
-        location = (job['location'] or '').lower()
-        if 'barcelona' not in location and 'spain' not in location and 'bcn' not in location:
-            continue
-        cid = job['company_id']
-        company_job_counts[cid] = company_job_counts.get(cid, 0) + 1
-        if is_great_fit(job['job_title'], job.get('description_full') or ''):
-            company_greatfit_counts[cid] = company_greatfit_counts.get(cid, 0) + 1
-
+def generate_companies_html(companies: dict, company_job_counts: dict[str, int],
+                            company_greatfit_counts: dict[str, int], updated: str):
+    """Generate the companies overview page from per-company job and great-fit counts."""
     rows = []
     for cid, info in sorted(companies.items(), key=lambda x: x[1].get('name', x[0]).lower()):
         name = info.get('name', cid)
@@ -832,7 +815,7 @@ def generate_companies_html(jobs: list[dict], companies: dict):
         hq = info.get('headquarters', '')
         careers_url = info.get('careers_url', '#')
         ethics = info.get('ethics_rating', 'neutral')
-        ethics_label = {'good': 'Good', 'neutral': 'Neutral', 'kinda_evil': 'Caution'}.get(ethics, ethics)
+        ethics_label = _ETHICS_LABEL.get(ethics, ethics)
         known_sponsor = info.get('known_visa_sponsor', False)
 
         job_count = company_job_counts.get(cid, 0)
@@ -860,122 +843,105 @@ def generate_companies_html(jobs: list[dict], companies: dict):
 
         greatfit_cell = f'<span class="jobs-count">{greatfit_count}</span>' if greatfit_count > 0 else '<span class="jobs-zero">0</span>'
 
-        rows.append(COMPANY_ROW_TEMPLATE.format(
-            name=name,
-            name_lower=name.lower(),
-            industry=industry,
-            industry_lower=industry.lower(),
-            hq=hq,
-            careers_url=careers_url,
-            job_count=job_count,
-            greatfit_count=greatfit_count,
-            jobs_cell=jobs_cell,
-            greatfit_cell=greatfit_cell,
-            visa_data=visa_data,
-            visa_class=visa_class,
-            visa_label=visa_label,
-            ethics=ethics,
-            ethics_label=ethics_label,
-        ))
+        # format_map takes the dict as-is, skipping the **kwargs repack of .format()
+        rows.append(COMPANY_ROW_TEMPLATE.format_map({
+            'name': name,
+            'name_lower': name.lower(),
+            'industry': industry,
+            'industry_lower': industry.lower(),
+            'hq': hq,
+            'careers_url': careers_url,
+            'job_count': job_count,
+            'greatfit_count': greatfit_count,
+            'jobs_cell': jobs_cell,
+            'greatfit_cell': greatfit_cell,
+            'visa_data': visa_data,
+            'visa_class': visa_class,
+            'visa_label': visa_label,
+            'ethics': ethics,
+            'ethics_label': ethics_label,
+        }))
 
     page = COMPANIES_PAGE_TEMPLATE.format(
-        updated=datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC'),
+        updated=updated,
         total_companies=len(companies),
         rows='\n'.join(rows),
     )
 
     COMPANIES_OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
     COMPANIES_OUTPUT_FILE.write_text(page)
+    write_gzip_sidecar(COMPANIES_OUTPUT_FILE)
     print(f"Generated {COMPANIES_OUTPUT_FILE} with {len(companies)} companies")
 
 
+RESUME_CSS = """\
+body { max-width: 900px; }
+.card {
+    background: white;
+    padding: 24px;
+    border-radius: 8px;
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+    margin-bottom: 20px;
+}
+.card h2 { margin-top: 0; color: #333; font-size: 18px; }
+label { display: block; font-weight: 500; color: #555; margin-bottom: 6px; }
+.job-info { display: flex; gap: 12px; margin-bottom: 16px; flex-wrap: wrap; }
+.job-info input {
+    flex: 1;
+    min-width: 180px;
+    padding: 8px 12px;
+    border: 1px solid #ddd;
+    border-radius: 6px;
+    font-size: 14px;
+}
+textarea {
+    width: 100%;
+    padding: 12px;
+    border: 1px solid #ddd;
+    border-radius: 6px;
+    font-size: 14px;
+    font-family: inherit;
+    resize: vertical;
+}
+textarea#jd-input { height: 220px; }
+textarea#prompt-output {
+    height: 400px;
+    font-family: 'Courier New', monospace;
+    font-size: 12px;
+    background: #f8f9fa;
+}
+.btn {
+    padding: 10px 24px;
+    border: none;
+    border-radius: 6px;
+    font-size: 15px;
+    font-weight: 600;
+    cursor: pointer;
+}
+.btn-primary { background: #0066cc; color: white; }
+.btn-primary:hover { background: #0052a3; }
+.btn-copy { background: #28a745; color: white; margin-left: 10px; }
+.btn-copy:hover { background: #218838; }
+.btn-copy.copied { background: #6c757d; }
+.output-header {
+    display: flex;
+    align-items: center;
+    justify-content: space-between;
+    margin-bottom: 8px;
+}
+.output-header h2 { margin: 0; font-size: 18px; color: #333; }
+.hint { color: #888; font-size: 13px; margin-top: 8px; }
+.hidden { display: none; }
+"""
+
 RESUME_PAGE_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Barcelona DS Jobs - Resume Builder</title>
-    <style>
-        * {{ box-sizing: border-box; }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            background: #f5f5f5;
-        }}
-        h1 {{ color: #333; }}
-        .nav {{ margin-bottom: 20px; }}
-        .nav a {{
-            display: inline-block;
-            padding: 8px 16px;
-            background: white;
-            border-radius: 6px;
-            text-decoration: none;
-            color: #0066cc;
-            font-weight: 500;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-            margin-right: 8px;
-        }}
-        .nav a:hover {{ background: #f0f0f0; }}
-        .nav a.active {{ background: #0066cc; color: white; }}
-        .card {{
-            background: white;
-            padding: 24px;
-            border-radius: 8px;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-            margin-bottom: 20px;
-        }}
-        .card h2 {{ margin-top: 0; color: #333; font-size: 18px; }}
-        label {{ display: block; font-weight: 500; color: #555; margin-bottom: 6px; }}
-        .job-info {{ display: flex; gap: 12px; margin-bottom: 16px; flex-wrap: wrap; }}
-        .job-info input {{
-            flex: 1;
-            min-width: 180px;
-            padding: 8px 12px;
-            border: 1px solid #ddd;
-            border-radius: 6px;
-            font-size: 14px;
-        }}
-        textarea {{
-            width: 100%;
-            padding: 12px;
-            border: 1px solid #ddd;
-            border-radius: 6px;
-            font-size: 14px;
-            font-family: inherit;
-            resize: vertical;
-        }}
-        textarea#jd-input {{ height: 220px; }}
-        textarea#prompt-output {{
-            height: 400px;
-            font-family: 'Courier New', monospace;
-            font-size: 12px;
-            background: #f8f9fa;
-        }}
-        .btn {{
-            padding: 10px 24px;
-            border: none;
-            border-radius: 6px;
-            font-size: 15px;
-            font-weight: 600;
-            cursor: pointer;
-        }}
-        .btn-primary {{ background: #0066cc; color: white; }}
-        .btn-primary:hover {{ background: #0052a3; }}
-        .btn-copy {{ background: #28a745; color: white; margin-left: 10px; }}
-        .btn-copy:hover {{ background: #218838; }}
-        .btn-copy.copied {{ background: #6c757d; }}
-        .output-header {{
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            margin-bottom: 8px;
-        }}
-        .output-header h2 {{ margin: 0; font-size: 18px; color: #333; }}
-        .hint {{ color: #888; font-size: 13px; margin-top: 8px; }}
-        .hidden {{ display: none; }}
-    </style>
+    <link rel="stylesheet" href="style.css">
+    <link rel="stylesheet" href="resume.css">
 </head>
 <body>
     <h1>Barcelona Data Science Jobs</h1>
@@ -1120,6 +1086,7 @@ def generate_resume_html():
     )
     RESUME_OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
     RESUME_OUTPUT_FILE.write_text(page)
+    write_gzip_sidecar(RESUME_OUTPUT_FILE)
     print(f"Generated {RESUME_OUTPUT_FILE}")
 
 
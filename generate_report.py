@@ -1,14 +1,13 @@
 #!/usr/bin/env python3
 """Generate daily CSV report of new job postings."""
 
-import json
+import csv
 import logging
+import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-import pandas as pd
-
-from models import get_new_jobs_since, DB_PATH
+from models import get_new_jobs_since, load_company_info, DB_PATH
 
 # Setup logging
 logging.basicConfig(
@@ -17,19 +16,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-COMPANIES_FILE = Path(__file__).parent / "data" / "companies.json"
 REPORTS_DIR = Path(__file__).parent / "reports"
 
-
-def load_company_info() -> dict:
-    """Load company metadata for enriching reports."""
-    if not COMPANIES_FILE.exists():
-        return {}
-
-    with open(COMPANIES_FILE) as f:
-        data = json.load(f)
-
-    return {c['id']: c for c in data.get('companies', [])}
+REPORT_FIELDS = ('Company', 'Title', 'Location', 'Posted Date', 'Ethics', 'Visa?', 'Apply URL', 'Notes')
 
 
 def generate_report(days_back: int = 1) -> Path:
@@ -56,37 +45,6 @@ def generate_report(days_back: int = 1) -> Path:
     # Load company info for enrichment
     companies = load_company_info()
 
-    # Build report data
-    rows = []
-    for job in jobs:
-        company_info = companies.get(job['company_id'], {})
-
-        # Determine visa status display (check both job posting and company data)
-        company_sponsors = company_info.get('known_visa_sponsor', False)
-
-        if job['mentions_visa']:
-            visa_status = 'Yes (job posting)'
-        elif job['mentions_relocation']:
-            visa_status = 'Maybe (relocation mentioned)'
-        elif company_sponsors:
-            visa_status = 'Likely (company sponsors)'
-        else:
-            visa_status = 'Unknown'
-
-        rows.append({
-            'Company': company_info.get('name', job['company_id']),
-            'Title': job['job_title'],
-            'Location': job['location'],
-            'Posted Date': job['posted_date'] or 'Unknown',
-            'Ethics': company_info.get('ethics_rating', 'Unknown'),
-            'Visa?': visa_status,
-            'Apply URL': job['job_url'],
-            'Notes': company_info.get('notes', ''),
-        })
-
-    # Create DataFrame and save
-    df = pd.DataFrame(rows)
-
     # Ensure reports directory exists
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -94,19 +52,53 @@ def generate_report(days_back: int = 1) -> Path:
     today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
     output_path = REPORTS_DIR / f"{today}_new_jobs.csv"
 
-    df.to_csv(output_path, index=False)
-    logger.info(f"Report saved to {output_path}")
+    # Show each job as soon as it is printed, even when stdout is piped (as in CI)
+    sys.stdout.reconfigure(line_buffering=True)
 
-    # Print summary to stdout
+    # Print summary header to stdout
     print(f"\n{'='*60}")
     print(f"NEW DATA ROLES IN BARCELONA - {today}")
     print(f"{'='*60}")
-    print(f"Total: {len(rows)} jobs\n")
+    print(f"Total: {len(jobs)} jobs\n")
+
+    # Each row is written to the CSV and printed in the same pass, without keeping a list of rows.
+    # lineterminator matches what pandas' to_csv wrote, keeping report diffs clean
+    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS, lineterminator='\n')
+        writer.writeheader()
+
+        for job in jobs:
+            company_info = companies.get(job['company_id'], {})
+
+            # Determine visa status display (check both job posting and company data)
+            company_sponsors = company_info.get('known_visa_sponsor', False)
+
+            if job['mentions_visa']:
+                visa_status = 'Yes (job posting)'
+            elif job['mentions_relocation']:
+                visa_status = 'Maybe (relocation mentioned)'
+            elif company_sponsors:
+                visa_status = 'Likely (company sponsors)'
+            else:
+                visa_status = 'Unknown'
+
+            row = {
+                'Company': company_info.get('name', job['company_id']),
+                'Title': job['job_title'],
+                'Location': job['location'],
+                'Posted Date': job['posted_date'] or 'Unknown',
+                'Ethics': company_info.get('ethics_rating', 'Unknown'),
+                'Visa?': visa_status,
+                'Apply URL': job['job_url'],
+                'Notes': company_info.get('notes', ''),
+            }
+            writer.writerow(row)
+
+            print(f"  [{row['Ethics']}] {row['Company']}: {row['Title']}")
+            print(f"       Location: {row['Location']} | Visa: {row['Visa?']}")
+            print(f"       {row['Apply URL']}\n")
 
-    for row in rows:
-        print(f"  [{row['Ethics']}] {row['Company']}: {row['Title']}")
-        print(f"       Location: {row['Location']} | Visa: {row['Visa?']}")
-        print(f"       {row['Apply URL']}\n")
+    logger.info(f"Report saved to {output_path}")
 
     return output_path
 
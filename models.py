@@ -1,18 +1,23 @@
 """Database models and setup for job tracking."""
 
-import sqlite3
+import atexit
+import functools
 import hashlib
+import sqlite3
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
+
+import orjson
 
 DB_PATH = Path(__file__).parent / "data" / "jobs.db"
+COMPANIES_FILE = Path(__file__).parent / "data" / "companies.json"
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
-    """Represents a job posting."""
+    """Represents a job posting. Slotted: scrapers create one per listing, often thousands a run."""
     company_id: str
     job_title: str
     job_url: str
@@ -29,16 +34,49 @@ class Job:
     def id(self) -> str:
         """Generate unique ID from company_id and job_url."""
         raw = f"{self.company_id}:{self.job_url}"
-        return hashlib.sha256(raw.encode()).hexdigest()[:16]
+        # Same value as hexdigest()[:16], without hex-encoding the 24 bytes that get dropped.
+        # Kept on SHA-256 so ids of rows already in jobs.db stay stable.
+        return hashlib.sha256(raw.encode()).digest()[:8].hex()
 
 
-def init_db() -> None:
-    """Initialize the SQLite database with required tables."""
+@functools.lru_cache(maxsize=1)
+def _get_conn() -> sqlite3.Connection:
+    """
+    Return the process-wide database connection, opening it on first use.
+    Writes are made from the main thread only (see scraper.main); check_same_thread
+    is relaxed so readers on other threads can share the connection.
+    """
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    # journal_mode is persistent: writers append to a WAL instead of rewriting pages
+    # through a rollback journal, and WAL makes synchronous=NORMAL safe. The rest
+    # keep sorts in memory and page the database through mmap.
+    conn.executescript("""
+        PRAGMA journal_mode = WAL;
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA cache_size = -65536;
+        PRAGMA mmap_size = 268435456;
+    """)
+    atexit.register(_close_conn, conn)
+    return conn
+
 
-    conn = sqlite3.connect(DB_PATH)
+def _close_conn(conn: sqlite3.Connection) -> None:
+    """Refresh planner statistics and close, checkpointing the WAL into jobs.db."""
+    # optimize only re-analyzes tables whose stats are stale, so it is cheap to run every time;
+    # closing the last connection folds the WAL back in, keeping the committed file self-contained
+    conn.execute("PRAGMA optimize")
+    conn.close()
+
+
+def init_db() -> None:
+    """Initialize the SQLite database with required tables."""
+    conn = _get_conn()
     cursor = conn.cursor()
 
+    # Flags are plain 0/1 integers; existing databases created with BOOLEAN columns
+    # have the same INTEGER affinity, so no migration is needed
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS jobs (
             id TEXT PRIMARY KEY,
@@ -50,10 +88,10 @@ def init_db() -> None:
             posted_date TEXT,
             scraped_date TEXT NOT NULL,
             description_full TEXT,
-            is_barcelona BOOLEAN,
-            is_data_role BOOLEAN,
-            mentions_visa BOOLEAN,
-            mentions_relocation BOOLEAN,
+            is_barcelona INTEGER NOT NULL CHECK (is_barcelona IN (0, 1)),
+            is_data_role INTEGER NOT NULL CHECK (is_data_role IN (0, 1)),
+            mentions_visa INTEGER NOT NULL CHECK (mentions_visa IN (0, 1)),
+            mentions_relocation INTEGER NOT NULL CHECK (mentions_relocation IN (0, 1)),
             status TEXT DEFAULT 'new',
             user_notes TEXT
         )
@@ -62,66 +100,117 @@ def init_db() -> None:
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_company ON jobs(company_id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_scraped_date ON jobs(scraped_date)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_status ON jobs(status)")
+    # Partial index holding only Barcelona data roles, the rows every report and the
+    # dashboard read, kept in newest-first order so those queries skip the sort.
+    # Queries must repeat "is_barcelona = 1 AND is_data_role = 1" for SQLite to use it.
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_matching
+        ON jobs(scraped_date DESC)
+        WHERE is_barcelona = 1 AND is_data_role = 1
+    """)
 
     conn.commit()
-    conn.close()
+
+
+def save_jobs(jobs: list[Job]) -> list[Job]:
+    """
+    Save jobs to the database in a single transaction.
+    Returns the jobs that were new; ones already stored are skipped.
+    """
+    if not jobs:
+        return []
+
+    scraped_date = datetime.utcnow().isoformat()
+    new_jobs = []
+
+    conn = _get_conn()
+    with conn:  # one transaction, committed on success and rolled back on error
+        cursor = conn.cursor()
+        for job in jobs:
+            # OR IGNORE replaces the old IntegrityError round trip; rowcount says if it was new
+            cursor.execute("""
+                INSERT OR IGNORE INTO jobs (
+                    id, company_id, job_title, job_url, location, department,
+                    posted_date, scraped_date, description_full, is_barcelona,
+                    is_data_role, mentions_visa, mentions_relocation
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                job.id,
+                job.company_id,
+                job.job_title,
+                job.job_url,
+                job.location,
+                job.department,
+                job.posted_date,
+                scraped_date,
+                job.description_full,
+                int(job.is_barcelona),
+                int(job.is_data_role),
+                int(job.mentions_visa),
+                int(job.mentions_relocation),
+            ))
+            if cursor.rowcount == 1:
+                new_jobs.append(job)
+
+    return new_jobs
 
 
 def save_job(job: Job) -> bool:
     """
     Save a job to the database. Returns True if new, False if already exists.
     """
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-
-    try:
-        cursor.execute("""
-            INSERT INTO jobs (
-                id, company_id, job_title, job_url, location, department,
-                posted_date, scraped_date, description_full, is_barcelona,
-                is_data_role, mentions_visa, mentions_relocation
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            job.id,
-            job.company_id,
-            job.job_title,
-            job.job_url,
-            job.location,
-            job.department,
-            job.posted_date,
-            datetime.utcnow().isoformat(),
-            job.description_full,
-            job.is_barcelona,
-            job.is_data_role,
-            job.mentions_visa,
-            job.mentions_relocation,
-        ))
-        conn.commit()
-        return True
-    except sqlite3.IntegrityError:
-        return False
-    finally:
-        conn.close()
+    return bool(save_jobs([job]))
 
 
 def get_new_jobs_since(since_date: str) -> list[dict]:
     """Get all jobs scraped since the given date."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
+    cursor = _get_conn().cursor()
+    cursor.row_factory = sqlite3.Row
 
     cursor.execute("""
         SELECT * FROM jobs
-        WHERE scraped_date >= ?
-        AND is_barcelona = 1
+        WHERE is_barcelona = 1
         AND is_data_role = 1
+        AND scraped_date >= ?
         ORDER BY scraped_date DESC
     """, (since_date,))
 
-    rows = cursor.fetchall()
-    conn.close()
+    return [dict(row) for row in cursor.fetchall()]
+
+
+def get_all_jobs(limit: Optional[int] = None, since: Optional[str] = None) -> Iterator[tuple]:
+    """
+    Yield Barcelona data jobs, newest first, as plain tuples of
+    (job_title, job_url, company_id, location, posted_date, scraped_date,
+     mentions_visa, mentions_relocation, description_full).
+    Optionally stop after `limit` rows and/or only include jobs scraped after `since`.
+    Rows are streamed from the cursor rather than fetched up front.
+    """
+    yield from _get_conn().execute("""
+        SELECT job_title, job_url, company_id, location, posted_date, scraped_date,
+               mentions_visa, mentions_relocation, description_full
+        FROM jobs
+        WHERE is_barcelona = 1 AND is_data_role = 1
+        -- LIKE is case-insensitive for ASCII, matching the old lowercase substring check
+        AND (location LIKE '%barcelona%' OR location LIKE '%spain%' OR location LIKE '%bcn%')
+        AND (:since IS NULL OR scraped_date > :since)
+        ORDER BY scraped_date DESC
+        LIMIT :limit
+    """, {'since': since, 'limit': -1 if limit is None else limit})
+
+
+@functools.lru_cache(maxsize=1)
+def load_company_list() -> list[dict]:
+    """Load the company list from companies.json, parsed once per process."""
+    if not COMPANIES_FILE.exists():
+        return []
+    return orjson.loads(COMPANIES_FILE.read_bytes()).get('companies', [])
+
 
-    return [dict(row) for row in rows]
+@functools.lru_cache(maxsize=1)
+def load_company_info() -> dict:
+    """Load company metadata from companies.json, keyed by company id."""
+    return {c['id']: c for c in load_company_list()}
 
 
 if __name__ == "__main__":
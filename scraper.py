@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 """Main scraping orchestrator - fetches jobs from all configured companies."""
 
-import json
 import logging
+import os
 import sys
+import threading
 import time
 from pathlib import Path
 
-from models import init_db, save_job
+from models import COMPANIES_FILE, init_db, load_company_list, save_jobs
 from scrapers import (
     scrape_greenhouse,
     scrape_lever,
@@ -26,6 +27,7 @@ from scrapers import (
     scrape_desigual,
     scrape_bsc,
     scrape_zurich,
+    run_scrapers_parallel,
 )
 
 # Setup logging
@@ -39,8 +41,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-COMPANIES_FILE = Path(__file__).parent / "data" / "companies.json"
-RATE_LIMIT_DELAY = 2  # seconds between companies
+# ats_platform -> (scraper, needs_ats_id). Custom scrapers know their own endpoints;
+# ATS scrapers are called with the company's board/account id as well.
+SCRAPERS = {
+    'amazon': (scrape_amazon, False),
+    'telefonica': (scrape_telefonica, False),
+    'microsoft_email': (scrape_microsoft_email, False),
+    'hp_email': (scrape_hp_email, False),
+    'revolut_email': (scrape_revolut_email, False),
+    'workday': (scrape_workday, False),
+    'sap': (scrape_sap, False),
+    'factorial': (scrape_factorial, False),
+    'edreams': (scrape_edreams, False),
+    'desigual': (scrape_desigual, False),
+    'bsc': (scrape_bsc, False),
+    'zurich': (scrape_zurich, False),
+    'greenhouse': (scrape_greenhouse, True),
+    'lever': (scrape_lever, True),
+    'workable': (scrape_workable, True),
+    'ashby': (scrape_ashby, True),
+    'smartrecruiters': (scrape_smartrecruiters, True),
+}
+
+RATE_LIMIT_DELAY = 2  # seconds between companies on the same platform
+# Companies scraped concurrently; the work is almost all HTTP wait
+MAX_WORKERS = int(os.environ.get('SCRAPER_MAX_WORKERS', 8))
+PER_PLATFORM_CONCURRENCY = 2  # companies in flight per platform at once
+
+# Throttling is per platform rather than global, since companies on the same
+# ATS share an API host while different platforms can be hit in parallel
+_platform_lock = threading.Lock()
+_platform_throttles: dict[str, tuple[threading.Semaphore, threading.Lock]] = {}
+_platform_last_start: dict[str, float] = {}
 
 
 def load_companies() -> list[dict]:
@@ -49,75 +81,78 @@ def load_companies() -> list[dict]:
         logger.error(f"Companies file not found: {COMPANIES_FILE}")
         return []
 
-    with open(COMPANIES_FILE) as f:
-        data = json.load(f)
+    return load_company_list()
 
-    return data.get('companies', [])
 
+def _throttle_key(ats_platform: str) -> str:
+    """Group platforms that hit the same upstream host."""
+    # All email scrapers read from the same Gmail IMAP account
+    return 'imap' if ats_platform.endswith('_email') else ats_platform
 
-def scrape_company(company: dict) -> int:
+
+def _get_platform_throttle(key: str) -> tuple[threading.Semaphore, threading.Lock]:
+    """Return the (concurrency slots, start lock) pair for a platform, creating it once."""
+    with _platform_lock:
+        if key not in _platform_throttles:
+            _platform_throttles[key] = (threading.Semaphore(PER_PLATFORM_CONCURRENCY), threading.Lock())
+        return _platform_throttles[key]
+
+
+def _wait_for_platform_turn(key: str, start_lock: threading.Lock) -> None:
+    """Space out company starts on one platform by RATE_LIMIT_DELAY seconds."""
+    with start_lock:
+        wait = _platform_last_start.get(key, 0.0) + RATE_LIMIT_DELAY - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _platform_last_start[key] = time.monotonic()
+
+
+def scrape_company(company: dict) -> list:
     """
-    Scrape jobs for a single company.
-    Returns count of new jobs saved.
+    Scrape jobs for a single company, throttled per platform.
+    Returns the scraped jobs; saving happens on the caller's thread.
     """
-    company_id = company['id']
     ats_platform = company.get('ats_platform', 'custom')
-    ats_id = company.get('ats_id', '')
 
     # Manual platforms - skip silently
     if ats_platform == 'manual':
-        return 0
-
-    # Custom scrapers that don't need ats_id
-    if ats_platform == 'amazon':
-        jobs = scrape_amazon(company_id)
-    elif ats_platform == 'telefonica':
-        jobs = scrape_telefonica(company_id)
-    elif ats_platform == 'microsoft_email':
-        jobs = scrape_microsoft_email(company_id)
-    elif ats_platform == 'hp_email':
-        jobs = scrape_hp_email(company_id)
-    elif ats_platform == 'revolut_email':
-        jobs = scrape_revolut_email(company_id)
-    elif ats_platform == 'workday':
-        jobs = scrape_workday(company_id)
-    elif ats_platform == 'sap':
-        jobs = scrape_sap(company_id)
-    elif ats_platform == 'factorial':
-        jobs = scrape_factorial(company_id)
-    elif ats_platform == 'edreams':
-        jobs = scrape_edreams(company_id)
-    elif ats_platform == 'desigual':
-        jobs = scrape_desigual(company_id)
-    elif ats_platform == 'bsc':
-        jobs = scrape_bsc(company_id)
-    elif ats_platform == 'zurich':
-        jobs = scrape_zurich(company_id)
-    elif not ats_id:
+        return []
+
+    key = _throttle_key(ats_platform)
+    slots, start_lock = _get_platform_throttle(key)
+    with slots:
+        _wait_for_platform_turn(key, start_lock)
+        return _fetch_company_jobs(company)
+
+
+def _fetch_company_jobs(company: dict) -> list:
+    """Dispatch to the scraper for the company's ATS platform."""
+    company_id = company['id']
+    ats_platform = company.get('ats_platform', 'custom')
+    ats_id = company.get('ats_id', '')
+
+    scraper, needs_ats_id = SCRAPERS.get(ats_platform, (None, False))
+    if scraper is not None and not needs_ats_id:
+        return scraper(company_id)
+    if not ats_id:
         logger.warning(f"No ATS ID configured for {company_id}, skipping")
-        return 0
-    elif ats_platform == 'greenhouse':
-        jobs = scrape_greenhouse(company_id, ats_id)
-    elif ats_platform == 'lever':
-        jobs = scrape_lever(company_id, ats_id)
-    elif ats_platform == 'workable':
-        jobs = scrape_workable(company_id, ats_id)
-    elif ats_platform == 'ashby':
-        jobs = scrape_ashby(company_id, ats_id)
-    elif ats_platform == 'smartrecruiters':
-        jobs = scrape_smartrecruiters(company_id, ats_id)
-    else:
+        return []
+    if scraper is None:
         logger.warning(f"Unsupported ATS platform '{ats_platform}' for {company_id}")
-        return 0
+        return []
+    return scraper(company_id, ats_id)
 
-    # Save jobs to database
-    new_count = 0
-    for job in jobs:
-        if save_job(job):
-            new_count += 1
-            logger.info(f"New job: {job.job_title} at {company_id}")
 
-    return new_count
+def save_company_jobs(company_id: str, jobs: list) -> int:
+    """
+    Save scraped jobs to the database.
+    Returns count of new jobs saved.
+    """
+    new_jobs = save_jobs(jobs)
+    for job in new_jobs:
+        logger.info(f"New job: {job.job_title} at {company_id}")
+
+    return len(new_jobs)
 
 
 def main():
@@ -136,22 +171,23 @@ def main():
 
     logger.info(f"Loaded {len(companies)} companies")
 
-    # Scrape each company
+    # Scrape companies concurrently; results are saved here on the main thread
+    # so only one thread ever writes to the database
     total_new = 0
     failed = 0
 
-    for i, company in enumerate(companies):
-        try:
-            new_count = scrape_company(company)
-            total_new += new_count
-        except Exception as e:
-            logger.error(f"Failed to scrape {company['id']}: {e}")
+    tasks = [(scrape_company, (company,)) for company in companies]
+    for (_, (company,)), jobs, error in run_scrapers_parallel(tasks, max_workers=MAX_WORKERS):
+        company_id = company['id']
+        if error is None:
+            try:
+                total_new += save_company_jobs(company_id, jobs)
+            except Exception as e:
+                error = e
+        if error is not None:
+            logger.error(f"Failed to scrape {company_id}: {error}")
             failed += 1
 
-        # Rate limiting (except for last company)
-        if i < len(companies) - 1:
-            time.sleep(RATE_LIMIT_DELAY)
-
     # Summary
     logger.info("-" * 50)
     logger.info(f"Scraping complete: {total_new} new jobs found")
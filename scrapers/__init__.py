@@ -16,6 +16,7 @@ from .factorial import scrape_factorial, scrape_holaluz
 from .edreams import scrape_edreams
 from .desigual import scrape_desigual
 from .bsc import scrape_bsc
+from ._parallel import run_scrapers_parallel
 
 __all__ = [
     'scrape_greenhouse',
@@ -37,4 +38,5 @@ __all__ = [
     'scrape_desigual',
     'scrape_bsc',
     'scrape_zurich',
+    'run_scrapers_parallel',
 ]
@@ -0,0 +1,164 @@
+"""Shared HTTP session for the scrapers."""
+
+import atexit
+import functools
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+MAX_REQUESTS_PER_HOST = 4  # in-flight requests per host across all scraper threads
+
+# Validators and bodies of previous responses. Kept out of jobs.db (which is committed)
+# and persisted between CI runs by the workflow's cache step instead.
+HTTP_CACHE_PATH = Path(__file__).parent.parent / "data" / "http_cache.db"
+DETAIL_CACHE_TTL = timedelta(hours=12)  # job detail pages rarely change while a posting is open
+CACHE_PRUNE_AGE = timedelta(days=1)  # unvalidated entries older than this are dropped
+
+_host_lock = threading.Lock()
+_host_slots: dict[str, threading.Semaphore] = {}
+
+
+def _host_semaphore(host: str) -> threading.Semaphore:
+    """Return the semaphore bounding concurrent requests to one host."""
+    with _host_lock:
+        if host not in _host_slots:
+            _host_slots[host] = threading.Semaphore(MAX_REQUESTS_PER_HOST)
+        return _host_slots[host]
+
+
+class _HostLimitedSession(requests.Session):
+    """Session that caps concurrent requests per host (netloc)."""
+
+    def request(self, method, url, *args, **kwargs):
+        with _host_semaphore(urlsplit(url).netloc):
+            return super().request(method, url, *args, **kwargs)
+
+
+# One pooled, keep-alive session reused by every scraper so repeat hits to the
+# same host (e.g. several Greenhouse boards) skip the TCP + TLS handshake.
+# Retries cover transient upstream failures; callers still handle RequestException.
+SESSION = _HostLimitedSession()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (compatible; JobTracker/1.0)',
+})
+
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        raise_on_status=False,  # hand back the last response so callers still see its status code
+        allowed_methods=None,  # also retry POSTs (Workable/Workday listing APIs are read-only)
+    ),
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+
+_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _cache_conn() -> sqlite3.Connection:
+    """Open the HTTP cache database, shared by all scraper threads behind _cache_lock."""
+    HTTP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(HTTP_CACHE_PATH, check_same_thread=False)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS http_cache (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            body BLOB,
+            fetched_at TEXT
+        )
+    """)
+    # Entries without validators are only reusable within their TTL; clear out old ones
+    # so postings that have closed eventually drop out of the file
+    with conn:
+        conn.execute(
+            "DELETE FROM http_cache WHERE etag IS NULL AND last_modified IS NULL AND fetched_at < ?",
+            ((datetime.now(timezone.utc) - CACHE_PRUNE_AGE).isoformat(),),
+        )
+    atexit.register(conn.close)
+    return conn
+
+
+def conditional_get(url: str, params: Optional[dict] = None, headers: Optional[dict] = None,
+                    timeout: int = 30) -> bytes:
+    """
+    GET a URL through SESSION, revalidating any cached copy with
+    If-None-Match / If-Modified-Since. Returns the response body, taken from the
+    cache when the server answers 304 Not Modified. Raises RequestException on
+    errors, like SESSION.get followed by raise_for_status().
+    """
+    full_url = requests.Request('GET', url, params=params).prepare().url
+    conn = _cache_conn()
+    with _cache_lock:
+        cached = conn.execute(
+            "SELECT etag, last_modified, body FROM http_cache WHERE url = ?", (full_url,)
+        ).fetchone()
+
+    request_headers = dict(headers or {})
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            request_headers['If-None-Match'] = etag
+        if last_modified:
+            request_headers['If-Modified-Since'] = last_modified
+
+    response = SESSION.get(full_url, headers=request_headers, timeout=timeout)
+    if response.status_code == 304 and cached:
+        return cached[2]
+    response.raise_for_status()
+
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if etag or last_modified:
+        with _cache_lock, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?)",
+                (full_url, etag, last_modified, response.content,
+                 datetime.now(timezone.utc).isoformat()),
+            )
+    return response.content
+
+
+def cached_request(method: str, url: str, json: Optional[dict] = None, headers: Optional[dict] = None,
+                   max_age: timedelta = DETAIL_CACHE_TTL, timeout: int = 30) -> bytes:
+    """
+    Send a request through SESSION, reusing a stored response body younger than
+    max_age instead of going to the network. Entries are keyed on the method, URL
+    and JSON body; headers (e.g. per-session CSRF tokens) are sent but not part of
+    the key. Raises RequestException on errors, like SESSION.request followed by
+    raise_for_status(); failed responses are never cached.
+    """
+    key = url if method == 'GET' and json is None else (
+        f"{method} {url} {orjson.dumps(json, option=orjson.OPT_SORT_KEYS).decode()}"
+    )
+    conn = _cache_conn()
+    cutoff = (datetime.now(timezone.utc) - max_age).isoformat()
+    with _cache_lock:
+        cached = conn.execute(
+            "SELECT body FROM http_cache WHERE url = ? AND fetched_at >= ?", (key, cutoff)
+        ).fetchone()
+    if cached:
+        return cached[0]
+
+    response = SESSION.request(method, url, json=json, headers=headers, timeout=timeout)
+    response.raise_for_status()
+    with _cache_lock, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO http_cache VALUES (?, NULL, NULL, ?, ?)",
+            (key, response.content, datetime.now(timezone.utc).isoformat()),
+        )
+    return response.content
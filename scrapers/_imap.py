@@ -0,0 +1,77 @@
+"""Shared IMAP connection for the email scrapers."""
+
+import atexit
+import imaplib
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+IMAP_HOST = "imap.gmail.com"
+
+
+class ImapLoginError(Exception):
+    """Raised when the IMAP server rejects the credentials."""
+
+
+class _ImapPool:
+    """
+    One logged-in connection per (host, user), kept for the life of the process
+    so the email scrapers don't each pay for a TLS handshake and LOGIN. Callers
+    take turns on a connection; dead ones are replaced on the next checkout.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connections: dict[tuple[str, str], imaplib.IMAP4_SSL] = {}
+
+    @contextmanager
+    def inbox(self, user: str, password: str, host: str = IMAP_HOST) -> Iterator[imaplib.IMAP4_SSL]:
+        """Check out the connection for this account with INBOX selected."""
+        key = (host, user)
+        with self._lock:
+            mail = self._connections.get(key)
+            if mail is not None:
+                try:
+                    mail.noop()
+                except (imaplib.IMAP4.error, OSError):
+                    mail = None  # dropped by the server since last use
+
+            if mail is None:
+                mail = imaplib.IMAP4_SSL(host)
+                try:
+                    mail.login(user, password)
+                except imaplib.IMAP4.error as e:
+                    raise ImapLoginError(e) from e
+                mail.select("inbox")
+                self._connections[key] = mail
+
+            try:
+                yield mail
+            except (imaplib.IMAP4.abort, OSError):
+                # The connection is unusable; reconnect on the next checkout
+                self._connections.pop(key, None)
+                raise
+
+    def close_all(self) -> None:
+        """Log out of every pooled connection."""
+        with self._lock:
+            for mail in self._connections.values():
+                try:
+                    mail.logout()
+                except (imaplib.IMAP4.error, OSError):
+                    pass
+            self._connections.clear()
+
+
+_POOL = _ImapPool()
+atexit.register(_POOL.close_all)
+
+imap_inbox = _POOL.inbox
+
+
+def from_any(senders: list[str]) -> str:
+    """Build a SEARCH key matching mail from any of the senders, e.g. OR FROM "a" FROM "b"."""
+    criteria = f'FROM "{senders[-1]}"'
+    for sender in reversed(senders[:-1]):
+        criteria = f'OR FROM "{sender}" {criteria}'
+    return criteria
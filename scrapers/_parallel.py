@@ -0,0 +1,24 @@
+"""Run scraper calls concurrently."""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, Optional
+
+Task = tuple[Callable[..., list], tuple]
+
+
+def run_scrapers_parallel(
+    tasks: Iterable[Task], max_workers: int = 8
+) -> Iterator[tuple[Task, Optional[list], Optional[Exception]]]:
+    """
+    Run (fn, args) scraper tasks on a thread pool, yielding (task, jobs, error)
+    in completion order. A task that raises yields its exception instead of jobs,
+    so one failing scraper doesn't stop the rest of the batch.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fn, *args): (fn, args) for fn, args in tasks}
+        for future in as_completed(futures):
+            task = futures[future]
+            try:
+                yield task, future.result(), None
+            except Exception as e:
+                yield task, None, e
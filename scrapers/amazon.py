@@ -1,11 +1,13 @@
 """Amazon Jobs scraper."""
 
 import logging
+import orjson
 import requests
 from typing import Optional
 
 from models import Job
-from utils import is_barcelona_role, is_data_role, is_english_posting, detect_visa_mentions
+from utils import LoweredText, classify_posting, is_english_text, is_worth_parsing, parse_posted_date
+from ._http import conditional_get
 
 logger = logging.getLogger(__name__)
 
@@ -36,15 +38,9 @@ def scrape_amazon(company_id: str, location: str = "Barcelona") -> list[Job]:
     }
 
     try:
-        response = requests.get(
-            AMAZON_API_BASE,
-            params=params,
-            timeout=30,
-            headers={"User-Agent": "Mozilla/5.0 (compatible; JobTracker/1.0)"},
-        )
-        response.raise_for_status()
-        data = response.json()
-    except requests.RequestException as e:
+        # Revalidates the last copy of the results; unchanged results cost a 304
+        data = orjson.loads(conditional_get(AMAZON_API_BASE, params=params))
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
         logger.error(f"Failed to fetch Amazon jobs for {company_id}: {e}")
         return jobs
 
@@ -53,7 +49,7 @@ def scrape_amazon(company_id: str, location: str = "Barcelona") -> list[Job]:
         if job and job.is_barcelona and job.is_data_role:
             jobs.append(job)
 
-    logger.info(f"Amazon [{company_id}]: Found {len(jobs)} matching jobs")
+    logger.info("Amazon [%s]: Found %d matching jobs", company_id, len(jobs))
     return jobs
 
 
@@ -63,6 +59,10 @@ def _parse_amazon_job(company_id: str, data: dict) -> Optional[Job]:
     location = data.get("normalized_location") or data.get("location", "")
     city = data.get("city", "")
 
+    # Cheap title/location check first; most non-matching postings stop here
+    if not is_worth_parsing(title, f"{location} {city}"):
+        return None
+
     # Build description from available fields
     description_parts = [
         data.get("description_short", ""),
@@ -77,23 +77,18 @@ def _parse_amazon_job(company_id: str, data: dict) -> Optional[Job]:
 
     department = data.get("job_category", "") or data.get("business_category", "")
 
+    # Lowercased once and shared by the language and classification checks
+    lowered = LoweredText.of(title, description, location)
+
     # Filter: must be English
-    if not is_english_posting(title, description):
+    if not is_english_text(lowered):
         return None
 
-    is_bcn = is_barcelona_role(location, title, description) or "barcelona" in city.lower()
-    is_data = is_data_role(title, description)
-    mentions_visa, mentions_relocation = detect_visa_mentions(description)
+    is_bcn, is_data, mentions_visa, mentions_relocation = classify_posting(lowered)
+    is_bcn = is_bcn or "barcelona" in city.lower()
 
     # Parse posted date (format: "January 13, 2026")
-    posted_date = data.get("posted_date", "")
-    if posted_date:
-        try:
-            from datetime import datetime
-            dt = datetime.strptime(posted_date, "%B %d, %Y")
-            posted_date = dt.strftime("%Y-%m-%d")
-        except ValueError:
-            posted_date = None
+    posted_date = parse_posted_date(data.get("posted_date", ""))
 
     return Job(
         company_id=company_id,
@@ -1,11 +1,13 @@
 """Ashby ATS scraper."""
 
 import logging
+import orjson
 import requests
 from typing import Optional
 
 from models import Job
-from utils import is_barcelona_role, is_data_role, is_english_posting, detect_visa_mentions
+from utils import LoweredText, classify_posting, is_english_text, is_worth_parsing
+from ._http import conditional_get
 
 logger = logging.getLogger(__name__)
 
@@ -25,12 +27,9 @@ def scrape_ashby(company_id: str, ashby_org: str) -> list[Job]:
     url = f"https://api.ashbyhq.com/posting-api/job-board/{ashby_org}"
 
     try:
-        response = requests.get(url, timeout=30, headers={
-            'User-Agent': 'Mozilla/5.0 (compatible; JobTracker/1.0)'
-        })
-        response.raise_for_status()
-        data = response.json()
-    except requests.RequestException as e:
+        # Revalidates the last copy of the board; an unchanged board costs a 304
+        data = orjson.loads(conditional_get(url))
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
         logger.error(f"Failed to fetch Ashby jobs for {company_id}: {e}")
         return jobs
 
@@ -39,7 +38,7 @@ def scrape_ashby(company_id: str, ashby_org: str) -> list[Job]:
         if job and job.is_barcelona and job.is_data_role:
             jobs.append(job)
 
-    logger.info(f"Ashby [{company_id}]: Found {len(jobs)} matching jobs")
+    logger.info("Ashby [%s]: Found %d matching jobs", company_id, len(jobs))
     return jobs
 
 
@@ -54,13 +53,18 @@ def _parse_ashby_job(company_id: str, ashby_org: str, data: dict) -> Optional[Jo
     # Construct application URL
     url = f"https://jobs.ashbyhq.com/{ashby_org}/{job_id}"
 
+    # Cheap title/location check first; most non-matching postings stop here
+    if not is_worth_parsing(title, location):
+        return None
+
+    # Lowercased once and shared by the language and classification checks
+    lowered = LoweredText.of(title, description, location)
+
     # Filter: must be English
-    if not is_english_posting(title, description):
+    if not is_english_text(lowered):
         return None
 
-    is_bcn = is_barcelona_role(location, title, description)
-    is_data = is_data_role(title, description)
-    mentions_visa, mentions_relocation = detect_visa_mentions(description)
+    is_bcn, is_data, mentions_visa, mentions_relocation = classify_posting(lowered)
 
     # Parse posted date
     posted_date = data.get('publishedAt', '')[:10] if data.get('publishedAt') else None
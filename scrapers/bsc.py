@@ -9,7 +9,8 @@ import requests
 from bs4 import BeautifulSoup
 
 from models import Job
-from utils import is_barcelona_role, is_data_role, detect_visa_mentions
+from utils import LoweredText, classify_posting
+from ._http import SESSION
 
 logger = logging.getLogger(__name__)
 
@@ -34,12 +35,12 @@ def scrape_bsc(company_id: str) -> list[Job]:
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
         }
 
-        resp = requests.get(JOBS_URL, headers=headers, timeout=30)
+        resp = SESSION.get(JOBS_URL, headers=headers, timeout=30)
         if resp.status_code != 200:
             logger.error(f"Failed to load BSC jobs: {resp.status_code}")
             return []
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.text, "lxml")
 
         # Find job links
         links = soup.select('a[href*="/job-opportunities/"]')
@@ -78,7 +79,7 @@ def scrape_bsc(company_id: str) -> list[Job]:
             if job and job.is_barcelona and job.is_data_role:
                 matching_jobs.append(job)
 
-        logger.info(f"BSC [{company_id}]: Found {len(matching_jobs)} matching jobs from {len(all_jobs)} total")
+        logger.info("BSC [%s]: Found %d matching jobs from %d total", company_id, len(matching_jobs), len(all_jobs))
         return matching_jobs
 
     except requests.RequestException as e:
@@ -98,9 +99,7 @@ def _create_job(company_id: str, job_data: dict) -> Optional[Job]:
     if not title or not url:
         return None
 
-    is_bcn = is_barcelona_role(location, title, "")
-    is_data = is_data_role(title, "")
-    mentions_visa, mentions_relocation = detect_visa_mentions("")
+    is_bcn, is_data, mentions_visa, mentions_relocation = classify_posting(LoweredText.of(title, "", location))
 
     return Job(
         company_id=company_id,
@@ -10,6 +10,7 @@ from bs4 import BeautifulSoup
 
 from models import Job
 from utils import is_barcelona_role, is_data_role, detect_visa_mentions
+from ._http import SESSION
 
 logger = logging.getLogger(__name__)
 
@@ -35,12 +36,12 @@ def scrape_edreams(company_id: str) -> list[Job]:
         }
 
         # Fetch jobs page
-        resp = requests.get(JOBS_URL, headers=headers, timeout=30)
+        resp = SESSION.get(JOBS_URL, headers=headers, timeout=30)
         if resp.status_code != 200:
             logger.error(f"Failed to load eDreams jobs page: {resp.status_code}")
             return []
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.text, "lxml")
 
         # Find job listings
         job_items = soup.select("li.job_listing")
@@ -50,13 +51,11 @@ def scrape_edreams(company_id: str) -> list[Job]:
             if job_data:
                 all_jobs.append(job_data)
 
-        # Deduplicate by URL
-        seen_urls = set()
-        unique_jobs = []
+        # Deduplicate by URL, keeping the first copy of each
+        first_by_url = {}
         for job in all_jobs:
-            if job["url"] not in seen_urls:
-                seen_urls.add(job["url"])
-                unique_jobs.append(job)
+            first_by_url.setdefault(job["url"], job)
+        unique_jobs = list(first_by_url.values())
 
         # Convert to Job objects and filter
         matching_jobs = []
@@ -65,7 +64,7 @@ def scrape_edreams(company_id: str) -> list[Job]:
             if job and job.is_barcelona and job.is_data_role:
                 matching_jobs.append(job)
 
-        logger.info(f"eDreams [{company_id}]: Found {len(matching_jobs)} matching jobs from {len(unique_jobs)} total")
+        logger.info("eDreams [%s]: Found %d matching jobs from %d total", company_id, len(matching_jobs), len(unique_jobs))
         return matching_jobs
 
     except requests.RequestException as e:
@@ -8,11 +8,13 @@ import re
 from datetime import datetime, timedelta
 from typing import Optional
 
-from bs4 import BeautifulSoup
+import lxml.html
 from dotenv import load_dotenv
+from lxml.etree import ParserError
 
 from models import Job
-from utils import is_barcelona_role, is_data_role, detect_visa_mentions
+from utils import LoweredText, classify_posting
+from ._imap import ImapLoginError, from_any, imap_inbox
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +46,20 @@ COMPANY_URL_PATTERNS = {
     "revolut": [r"revolut\.com/careers", r"revolut\.com/.*position"],
 }
 
+# Job link matchers, one alternation per company, compiled once at import
+JOB_LINK_RES = {
+    company_id: re.compile("|".join(patterns), re.IGNORECASE)
+    for company_id, patterns in COMPANY_URL_PATTERNS.items()
+}
+
+FETCH_BATCH_SIZE = 100  # message ids per IMAP FETCH command
+
+# Location hints in priority order, plus the phrase pattern used to pull out the full location
+LOCATION_HINTS = ("Barcelona", "Sant Cugat", "Spain", "Madrid", "Remote", "Hybrid")
+LOCATION_HINT_RE = re.compile("|".join(LOCATION_HINTS), re.IGNORECASE)
+LOCATION_PHRASE_RE = re.compile(r"([A-Za-z\s,]+(?:Spain|Barcelona|Madrid|Sant Cugat|Remote)[A-Za-z\s,]*)")
+QUERY_STRING_RE = re.compile(r"\?.*$")
+
 
 def scrape_email_alerts(company_id: str, days_back: int = 7) -> list[Job]:
     """
@@ -67,41 +83,40 @@ def scrape_email_alerts(company_id: str, days_back: int = 7) -> list[Job]:
     jobs = []
 
     try:
-        mail = imaplib.IMAP4_SSL("imap.gmail.com")
-        try:
-            mail.login(GMAIL_ADDRESS, GMAIL_APP_PASSWORD)
-        except imaplib.IMAP4.error as e:
-            logger.warning(f"Gmail authentication failed, skipping {company_id} email scraper: {e}")
-            return []
-        mail.select("inbox")
-
-        since_date = (datetime.now() - timedelta(days=days_back)).strftime("%d-%b-%Y")
-
-        for sender in COMPANY_SENDERS[company_id]:
-            search_criteria = f'(FROM "{sender}" SINCE "{since_date}")'
-
-            try:
-                status, message_ids = mail.search(None, search_criteria)
-                if status != "OK":
-                    continue
-
-                for msg_id in message_ids[0].split():
-                    status, msg_data = mail.fetch(msg_id, "(RFC822)")
+        # Reuses the process-wide Gmail connection shared with the other email scrapers
+        with imap_inbox(GMAIL_ADDRESS, GMAIL_APP_PASSWORD) as mail:
+            since_date = (datetime.now() - timedelta(days=days_back)).strftime("%d-%b-%Y")
+            # One SEARCH covering every sender for the company
+            search_criteria = f'({from_any(COMPANY_SENDERS[company_id])} SINCE "{since_date}")'
+
+            status, message_ids = mail.search(None, search_criteria)
+            ids = message_ids[0].split() if status == "OK" else []
+
+            # One round trip per batch instead of per message; BODY.PEEK[] returns the
+            # same bytes as RFC822 without marking the alerts as read
+            for start in range(0, len(ids), FETCH_BATCH_SIZE):
+                batch = b",".join(ids[start:start + FETCH_BATCH_SIZE])
+                # A failed batch is skipped rather than discarding the jobs already collected
+                try:
+                    status, msg_data = mail.fetch(batch.decode(), "(BODY.PEEK[])")
                     if status != "OK":
                         continue
 
-                    email_body = msg_data[0][1]
-                    msg = email.message_from_bytes(email_body)
+                    # Each message arrives as a (envelope, body) tuple, separated by b")" entries
+                    for item in msg_data:
+                        if not isinstance(item, tuple):
+                            continue
+                        msg = email.message_from_bytes(item[1])
 
-                    email_jobs = _parse_job_alert_email(company_id, msg)
-                    jobs.extend(email_jobs)
-
-            except Exception as e:
-                logger.debug(f"Error searching for {sender}: {e}")
-                continue
-
-        mail.logout()
+                        email_jobs = _parse_job_alert_email(company_id, msg)
+                        jobs.extend(email_jobs)
+                except Exception as e:
+                    logger.debug(f"Error fetching {company_id} alert batch at {start}: {e}")
+                    continue
 
+    except ImapLoginError as e:
+        logger.warning(f"Gmail authentication failed, skipping {company_id} email scraper: {e}")
+        return []
     except imaplib.IMAP4.error as e:
         logger.error(f"IMAP error connecting to Gmail: {e}")
         return []
@@ -109,18 +124,17 @@ def scrape_email_alerts(company_id: str, days_back: int = 7) -> list[Job]:
         logger.error(f"Failed to fetch job emails for {company_id}: {e}")
         return []
 
-    # Deduplicate by URL
-    seen_urls = set()
-    unique_jobs = []
+    # Deduplicate by URL, keeping the first copy of each (later ones are often
+    # "View job"/"Apply" links parsed with fallback details)
+    first_by_url = {}
     for job in jobs:
-        if job.job_url not in seen_urls:
-            seen_urls.add(job.job_url)
-            unique_jobs.append(job)
+        first_by_url.setdefault(job.job_url, job)
+    unique_jobs = list(first_by_url.values())
 
     # Filter to matching jobs
     matching_jobs = [j for j in unique_jobs if j.is_barcelona and j.is_data_role]
 
-    logger.info(f"Email Alerts [{company_id}]: Found {len(matching_jobs)} matching jobs from {len(unique_jobs)} total")
+    logger.info("Email Alerts [%s]: Found %d matching jobs from %d total", company_id, len(matching_jobs), len(unique_jobs))
     return matching_jobs
 
 
@@ -128,50 +142,54 @@ def _parse_job_alert_email(company_id: str, msg: email.message.Message) -> list[
     """Parse jobs from a job alert email."""
     jobs = []
 
-    # Get email body (prefer HTML)
-    body = ""
+    # Pick the body part (prefer HTML) first, so only that one part is decoded
+    part = msg
     if msg.is_multipart():
-        for part in msg.walk():
-            content_type = part.get_content_type()
+        html_part = text_part = None
+        for candidate in msg.walk():
+            content_type = candidate.get_content_type()
             if content_type == "text/html":
-                payload = part.get_payload(decode=True)
-                if payload:
-                    body = payload.decode("utf-8", errors="ignore")
-                    break
-            elif content_type == "text/plain" and not body:
-                payload = part.get_payload(decode=True)
-                if payload:
-                    body = payload.decode("utf-8", errors="ignore")
-    else:
-        payload = msg.get_payload(decode=True)
-        if payload:
-            body = payload.decode("utf-8", errors="ignore")
-
-    if not body:
+                html_part = candidate
+                break
+            if content_type == "text/plain" and text_part is None:
+                text_part = candidate
+        part = html_part or text_part
+        if part is None:
+            return jobs
+
+    payload = part.get_payload(decode=True)
+    if not payload:
         return jobs
 
-    soup = BeautifulSoup(body, "html.parser")
+    # Hand lxml the raw bytes and let it decode them using the part's declared charset
+    try:
+        parser = lxml.html.HTMLParser(encoding=part.get_content_charset() or "utf-8")
+    except LookupError:  # unknown or misspelled charset; parse as utf-8 rather than drop the email
+        parser = lxml.html.HTMLParser(encoding="utf-8")
+    try:
+        tree = lxml.html.document_fromstring(payload, parser=parser)
+    except ParserError:  # nothing but whitespace/comments
+        return jobs
 
     # Find job links matching company URL patterns
-    url_patterns = COMPANY_URL_PATTERNS.get(company_id, [])
-    combined_pattern = "|".join(url_patterns) if url_patterns else company_id
+    link_re = JOB_LINK_RES.get(company_id) or re.compile(company_id, re.IGNORECASE)
 
-    job_links = soup.find_all("a", href=re.compile(combined_pattern, re.IGNORECASE))
-
-    for link in job_links:
-        href = link.get("href", "")
-        if not href or "unsubscribe" in href.lower() or "privacy" in href.lower():
+    for link in tree.iter("a"):
+        href = link.get("href")
+        if not href or not link_re.search(href):
+            continue
+        if "unsubscribe" in href.lower() or "privacy" in href.lower():
             continue
 
-        title = link.get_text(strip=True)
+        title = _stripped_text(link)
 
         # Skip non-job links
         if not title or len(title) < 5:
-            parent = link.find_parent(["tr", "div", "td"])
-            if parent:
-                title_elem = parent.find(["h2", "h3", "h4", "strong", "b"])
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
+            parent = next(link.iterancestors("tr", "div", "td"), None)
+            if parent is not None:
+                title_elem = next(parent.iter("h2", "h3", "h4", "strong", "b"), None)
+                if title_elem is not None:
+                    title = _stripped_text(title_elem)
                 else:
                     continue
             else:
@@ -188,33 +206,29 @@ def _parse_job_alert_email(company_id: str, msg: email.message.Message) -> list[
     return jobs
 
 
+def _stripped_text(element) -> str:
+    """Join an element's text nodes, each stripped (like BeautifulSoup's get_text(strip=True))."""
+    return "".join(text.strip() for text in element.itertext())
+
+
 def _extract_location_near_link(link) -> str:
     """Try to extract location from elements near the job link."""
-    parent = link.find_parent(["tr", "div", "td", "li"])
-    if not parent:
+    parent = next(link.iterancestors("tr", "div", "td", "li"), None)
+    if parent is None:
         return ""
 
-    text = parent.get_text()
-    location_patterns = [
-        r"Barcelona",
-        r"Sant Cugat",
-        r"Spain",
-        r"Madrid",
-        r"Remote",
-        r"Hybrid",
-    ]
-
-    for pattern in location_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            match = re.search(
-                r"([A-Za-z\s,]+(?:Spain|Barcelona|Madrid|Sant Cugat|Remote)[A-Za-z\s,]*)",
-                text,
-            )
-            if match:
-                return match.group(1).strip()
-            return pattern
-
-    return ""
+    text = parent.text_content()
+    # One pass over the text to see whether any hint is present at all
+    if not LOCATION_HINT_RE.search(text):
+        return ""
+
+    match = LOCATION_PHRASE_RE.search(text)
+    if match:
+        return match.group(1).strip()
+
+    # Fall back to the highest-priority hint that appears
+    text_lower = text.lower()
+    return next(hint for hint in LOCATION_HINTS if hint.lower() in text_lower)
 
 
 def _create_job(company_id: str, title: str, url: str, location: str) -> Optional[Job]:
@@ -227,11 +241,9 @@ def _create_job(company_id: str, title: str, url: str, location: str) -> Optiona
         url = "https:" + url if url.startswith("//") else "https://" + url
 
     # Remove tracking parameters
-    url = re.sub(r"\?.*$", "", url)
+    url = QUERY_STRING_RE.sub("", url)
 
-    is_bcn = is_barcelona_role(location, title, "")
-    is_data = is_data_role(title, "")
-    mentions_visa, mentions_relocation = detect_visa_mentions("")
+    is_bcn, is_data, mentions_visa, mentions_relocation = classify_posting(LoweredText.of(title, "", location))
 
     return Job(
         company_id=company_id,
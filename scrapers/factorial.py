@@ -10,6 +10,7 @@ from bs4 import BeautifulSoup
 
 from models import Job
 from utils import is_barcelona_role, is_data_role, detect_visa_mentions
+from ._http import SESSION
 
 logger = logging.getLogger(__name__)
 
@@ -41,12 +42,12 @@ def scrape_factorial(company_id: str) -> list[Job]:
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
         }
 
-        resp = requests.get(careers_url, headers=headers, timeout=30)
+        resp = SESSION.get(careers_url, headers=headers, timeout=30)
         if resp.status_code != 200:
             logger.error(f"Failed to load Factorial page for {company_id}: {resp.status_code}")
             return []
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(resp.text, "lxml")
 
         # Find job listings
         job_items = soup.select("li.job-offer-item")
@@ -64,7 +65,7 @@ def scrape_factorial(company_id: str) -> list[Job]:
             if job and job.is_barcelona and job.is_data_role:
                 matching_jobs.append(job)
 
-        logger.info(f"Factorial [{company_id}]: Found {len(matching_jobs)} matching jobs from {len(all_jobs)} total")
+        logger.info("Factorial [%s]: Found %d matching jobs from %d total", company_id, len(matching_jobs), len(all_jobs))
         return matching_jobs
 
     except requests.RequestException as e:
@@ -1,12 +1,14 @@
 """Lever ATS scraper."""
 
 import logging
+import orjson
 import requests
 from datetime import datetime
 from typing import Optional
 
 from models import Job
-from utils import is_barcelona_role, is_data_role, is_english_posting, detect_visa_mentions
+from utils import LoweredText, classify_posting, is_english_text
+from ._http import conditional_get
 
 logger = logging.getLogger(__name__)
 
@@ -26,12 +28,9 @@ def scrape_lever(company_id: str, lever_company: str) -> list[Job]:
     url = f"https://api.lever.co/v0/postings/{lever_company}"
 
     try:
-        response = requests.get(url, timeout=30, headers={
-            'User-Agent': 'Mozilla/5.0 (compatible; JobTracker/1.0)'
-        })
-        response.raise_for_status()
-        data = response.json()
-    except requests.RequestException as e:
+        # Revalidates the last copy of the listing; an unchanged listing costs a 304
+        data = orjson.loads(conditional_get(url))
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
         logger.error(f"Failed to fetch Lever jobs for {company_id}: {e}")
         return jobs
 
@@ -40,7 +39,7 @@ def scrape_lever(company_id: str, lever_company: str) -> list[Job]:
         if job and job.is_barcelona and job.is_data_role:
             jobs.append(job)
 
-    logger.info(f"Lever [{company_id}]: Found {len(jobs)} matching jobs")
+    logger.info("Lever [%s]: Found %d matching jobs", company_id, len(jobs))
     return jobs
 
 
@@ -53,13 +52,14 @@ def _parse_lever_job(company_id: str, data: dict) -> Optional[Job]:
     description = data.get('descriptionPlain', '') or data.get('description', '')
     url = data.get('hostedUrl', '')
 
+    # Lowercased once and shared by the language and classification checks
+    lowered = LoweredText.of(title, description, location)
+
     # Filter: must be English
-    if not is_english_posting(title, description):
+    if not is_english_text(lowered):
         return None
 
-    is_bcn = is_barcelona_role(location, title, description)
-    is_data = is_data_role(title, description)
-    mentions_visa, mentions_relocation = detect_visa_mentions(description)
+    is_bcn, is_data, mentions_visa, mentions_relocation = classify_posting(lowered)
 
     # Parse posted date from timestamp
     created_at = data.get('createdAt')
@@ -7,13 +7,14 @@ import os
 import re
 from datetime import datetime, timedelta
 from email.header import decode_header
-from typing import Optional
+from typing import Iterator, Optional
 
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
 from models import Job
-from utils import is_barcelona_role, is_data_role, detect_visa_mentions
+from utils import LoweredText, classify_posting
+from ._imap import ImapLoginError, from_any, imap_inbox
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,35 @@ MICROSOFT_SENDERS = [
     "jobs-noreply@linkedin.com",  # LinkedIn job alerts for Microsoft
 ]
 
+# Job links: Microsoft careers URLs (jobs.careers.microsoft.com included) and its Eightfold ATS.
+# Substring attribute selectors are matched by soupsieve without a regex per anchor.
+JOB_LINK_SELECTOR = ", ".join(
+    f'a[href*="{domain}"]' for domain in ("careers.microsoft.com", "microsoft.eightfold.ai")
+)
+
+# Location hints in priority order, plus the phrase pattern used to pull out the full location
+LOCATION_HINTS = ("Barcelona", "Spain", "Madrid", "Remote", "Hybrid")
+LOCATION_HINT_RE = re.compile("|".join(LOCATION_HINTS), re.IGNORECASE)
+LOCATION_PHRASE_RE = re.compile(r"([A-Za-z\s,]+(?:Spain|Barcelona|Madrid|Remote)[A-Za-z\s,]*)")
+
+# Gmail full-text search terms ({} means OR). A job can only pass is_barcelona_role if
+# its alert contains one of utils.BARCELONA_LITERALS, so Gmail's index drops the other
+# alerts from the same senders before anything is fetched. Gmail matches whole words,
+# so the 'catalun' stem is spelled out as the words it covers. imaplib sends commands
+# as ASCII, so accented BARCELONA_LITERALS must be added here transliterated (Gmail
+# search ignores accents, so 'espana' also matches 'españa').
+GMAIL_LOCATION_QUERY = "{barcelona bcn spain espana palau cugat catalunya cataluna catalonia}"
+
+FETCH_BATCH_SIZE = 100  # message ids per IMAP FETCH command
+
+# Only the MIME headers needed to split the body into parts, plus the body itself.
+# PEEK leaves the alerts unread, and the rest of the header block (Received chains,
+# DKIM signatures, ...) is never downloaded.
+FETCH_SPEC = "(BODY.PEEK[HEADER.FIELDS (MIME-VERSION CONTENT-TYPE CONTENT-TRANSFER-ENCODING)] BODY.PEEK[TEXT])"
+
+# Message sequence number opening a FETCH response line, e.g. b'12 (BODY[TEXT] {4200}'
+FETCH_SEQUENCE_RE = re.compile(rb"^(\d+) \(")
+
 
 def scrape_microsoft_email(company_id: str, days_back: int = 7) -> list[Job]:
     """
@@ -50,44 +80,37 @@ def scrape_microsoft_email(company_id: str, days_back: int = 7) -> list[Job]:
     jobs = []
 
     try:
-        # Connect to Gmail IMAP
-        mail = imaplib.IMAP4_SSL("imap.gmail.com")
-        try:
-            mail.login(GMAIL_ADDRESS, GMAIL_APP_PASSWORD)
-        except imaplib.IMAP4.error as e:
-            logger.warning(f"Gmail authentication failed, skipping Microsoft email scraper: {e}")
-            return []
-        mail.select("inbox")
-
-        # Search for Microsoft job alert emails from the last N days
-        since_date = (datetime.now() - timedelta(days=days_back)).strftime("%d-%b-%Y")
-
-        for sender in MICROSOFT_SENDERS:
-            search_criteria = f'(FROM "{sender}" SINCE "{since_date}")'
-
-            try:
-                status, message_ids = mail.search(None, search_criteria)
-                if status != "OK":
-                    continue
-
-                for msg_id in message_ids[0].split():
-                    status, msg_data = mail.fetch(msg_id, "(RFC822)")
+        # Reuses the process-wide Gmail connection shared with the other email scrapers
+        with imap_inbox(GMAIL_ADDRESS, GMAIL_APP_PASSWORD) as mail:
+            # Search for Microsoft job alert emails from the last N days, all senders at once
+            since_date = (datetime.now() - timedelta(days=days_back)).strftime("%d-%b-%Y")
+            search_criteria = (
+                f'({from_any(MICROSOFT_SENDERS)} SINCE "{since_date}" X-GM-RAW "{GMAIL_LOCATION_QUERY}")'
+            )
+
+            status, message_ids = mail.search(None, search_criteria)
+            ids = message_ids[0].split() if status == "OK" else []
+
+            # One round trip per batch of messages instead of one per message
+            for start in range(0, len(ids), FETCH_BATCH_SIZE):
+                batch = b",".join(ids[start:start + FETCH_BATCH_SIZE])
+                # A failed batch is skipped rather than discarding the jobs already collected
+                try:
+                    status, msg_data = mail.fetch(batch.decode(), FETCH_SPEC)
                     if status != "OK":
                         continue
 
-                    email_body = msg_data[0][1]
-                    msg = email.message_from_bytes(email_body)
-
-                    # Parse jobs from this email
-                    email_jobs = _parse_microsoft_email(company_id, msg)
-                    jobs.extend(email_jobs)
-
-            except Exception as e:
-                logger.debug(f"Error searching for {sender}: {e}")
-                continue
-
-        mail.logout()
+                    for msg in _iter_fetched_messages(msg_data):
+                        # Parse jobs from this email
+                        email_jobs = _parse_microsoft_email(company_id, msg)
+                        jobs.extend(email_jobs)
+                except Exception as e:
+                    logger.debug(f"Error fetching Microsoft alert batch at {start}: {e}")
+                    continue
 
+    except ImapLoginError as e:
+        logger.warning(f"Gmail authentication failed, skipping Microsoft email scraper: {e}")
+        return []
     except imaplib.IMAP4.error as e:
         logger.error(f"IMAP error connecting to Gmail: {e}")
         return []
@@ -95,21 +118,49 @@ def scrape_microsoft_email(company_id: str, days_back: int = 7) -> list[Job]:
         logger.error(f"Failed to fetch Microsoft job emails: {e}")
         return []
 
-    # Deduplicate by URL
-    seen_urls = set()
-    unique_jobs = []
+    # Deduplicate by URL, keeping the first copy of each (later ones are often
+    # "View job"/"Apply" links parsed with fallback details)
+    first_by_url = {}
     for job in jobs:
-        if job.job_url not in seen_urls:
-            seen_urls.add(job.job_url)
-            unique_jobs.append(job)
+        first_by_url.setdefault(job.job_url, job)
+    unique_jobs = list(first_by_url.values())
 
     # Filter to matching jobs
     matching_jobs = [j for j in unique_jobs if j.is_barcelona and j.is_data_role]
 
-    logger.info(f"Microsoft Email [{company_id}]: Found {len(matching_jobs)} matching jobs from {len(unique_jobs)} total")
+    logger.info("Microsoft Email [%s]: Found %d matching jobs from %d total", company_id, len(matching_jobs), len(unique_jobs))
     return matching_jobs
 
 
+def _iter_fetched_messages(msg_data: list) -> Iterator[email.message.Message]:
+    """
+    Rebuild messages from a FETCH_SPEC response. Each section arrives as an
+    (envelope, literal) tuple; the server may send them in either order, so they
+    are matched by section name and grouped by the message sequence number that
+    opens each message's response (later literals of a message continue it).
+    """
+    sections: dict[bytes, dict[str, bytes]] = {}
+    sequence = None
+    for item in msg_data:
+        if not isinstance(item, tuple):
+            continue
+        envelope = item[0].upper()
+        match = FETCH_SEQUENCE_RE.match(envelope)
+        if match:
+            sequence = match.group(1)
+        if sequence is None:
+            continue
+
+        if b"BODY[HEADER.FIELDS" in envelope:
+            sections.setdefault(sequence, {})["headers"] = item[1]
+        elif b"BODY[TEXT]" in envelope:
+            sections.setdefault(sequence, {})["text"] = item[1]
+
+    for parts in sections.values():
+        if "text" in parts:
+            yield email.message_from_bytes(parts.get("headers", b"") + parts["text"])
+
+
 def _parse_microsoft_email(company_id: str, msg: email.message.Message) -> list[Job]:
     """Parse jobs from a Microsoft job alert email."""
     jobs = []
@@ -136,10 +187,10 @@ def _parse_microsoft_email(company_id: str, msg: email.message.Message) -> list[
     if not body:
         return jobs
 
-    soup = BeautifulSoup(body, "html.parser")
+    soup = BeautifulSoup(body, "lxml")
 
     # Look for job links - Microsoft careers URLs (including Eightfold ATS)
-    job_links = soup.find_all("a", href=re.compile(r"careers\.microsoft\.com|jobs\.careers\.microsoft\.com|microsoft\.eightfold\.ai"))
+    job_links = soup.select(JOB_LINK_SELECTOR)
 
     for link in job_links:
         href = link.get("href", "")
@@ -181,25 +232,19 @@ def _extract_location_near_link(link) -> str:
     if not parent:
         return ""
 
-    # Common location patterns
-    location_patterns = [
-        r"Barcelona",
-        r"Spain",
-        r"Madrid",
-        r"Remote",
-        r"Hybrid",
-    ]
-
     text = parent.get_text()
-    for pattern in location_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            # Try to extract the full location string
-            match = re.search(r"([A-Za-z\s,]+(?:Spain|Barcelona|Madrid|Remote)[A-Za-z\s,]*)", text)
-            if match:
-                return match.group(1).strip()
-            return pattern
+    # One pass over the text to see whether any hint is present at all
+    if not LOCATION_HINT_RE.search(text):
+        return ""
+
+    # Try to extract the full location string
+    match = LOCATION_PHRASE_RE.search(text)
+    if match:
+        return match.group(1).strip()
 
-    return ""
+    # Fall back to the highest-priority hint that appears
+    text_lower = text.lower()
+    return next(hint for hint in LOCATION_HINTS if hint.lower() in text_lower)
 
 
 def _create_job(company_id: str, title: str, url: str, location: str) -> Optional[Job]:
@@ -214,9 +259,7 @@ def _create_job(company_id: str, title: str, url: str, location: str) -> Optiona
     # Remove tracking parameters
     url = re.sub(r"\?.*$", "", url)
 
-    is_bcn = is_barcelona_role(location, title, "")
-    is_data = is_data_role(title, "")
-    mentions_visa, mentions_relocation = detect_visa_mentions("")
+    is_bcn, is_data, mentions_visa, mentions_relocation = classify_posting(LoweredText.of(title, "", location))
 
     return Job(
         company_id=company_id,
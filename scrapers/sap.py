@@ -2,14 +2,17 @@
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml.etree import ParserError
 
 from models import Job
-from utils import is_barcelona_role, is_data_role, detect_visa_mentions
+from utils import LoweredText, classify_posting, parse_posted_date
+from ._http import SESSION
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +20,18 @@ BASE_URL = "https://jobs.sap.com"
 SEARCH_URL = f"{BASE_URL}/search/"
 
 
+def _class_xpath(tag: str, class_name: str) -> str:
+    """XPath step matching `tag` elements that carry `class_name` (like the CSS selector tag.class_name)."""
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+# Result rows and their fields, evaluated by libxml2 without building a BeautifulSoup tree
+ROW_XPATH = "//" + _class_xpath("tr", "data-row")
+TITLE_XPATH = ".//" + _class_xpath("a", "jobTitle-link")
+LOCATION_XPATH = ".//" + _class_xpath("span", "jobLocation")
+DATE_XPATH = ".//" + _class_xpath("span", "jobDate")
+
+
 def scrape_sap(company_id: str) -> list[Job]:
     """
     Scrape SAP jobs from their careers site.
@@ -32,20 +47,20 @@ def scrape_sap(company_id: str) -> list[Job]:
     # Search for data-related jobs in Barcelona
     search_terms = ["data", "machine learning", "AI", "analyst", "scientist"]
 
-    for term in search_terms:
+    # The searches are independent, so run them concurrently rather than one after another
+    with ThreadPoolExecutor(max_workers=len(search_terms)) as executor:
+        futures = {term: executor.submit(_search_sap_jobs, term, "barcelona") for term in search_terms}
+    for term, future in futures.items():
         try:
-            jobs = _search_sap_jobs(term, "barcelona")
-            all_jobs.extend(jobs)
+            all_jobs.extend(future.result())
         except Exception as e:
             logger.error(f"Error searching SAP for '{term}': {e}")
 
-    # Deduplicate by URL
-    seen_urls = set()
-    unique_jobs = []
+    # Deduplicate by URL, keeping the first copy of each
+    first_by_url = {}
     for job in all_jobs:
-        if job["url"] not in seen_urls:
-            seen_urls.add(job["url"])
-            unique_jobs.append(job)
+        first_by_url.setdefault(job["url"], job)
+    unique_jobs = list(first_by_url.values())
 
     # Convert to Job objects and filter
     matching_jobs = []
@@ -54,7 +69,7 @@ def scrape_sap(company_id: str) -> list[Job]:
         if job and job.is_barcelona and job.is_data_role:
             matching_jobs.append(job)
 
-    logger.info(f"SAP [{company_id}]: Found {len(matching_jobs)} matching jobs from {len(unique_jobs)} total")
+    logger.info("SAP [%s]: Found %d matching jobs from %d total", company_id, len(matching_jobs), len(unique_jobs))
     return matching_jobs
 
 
@@ -72,28 +87,29 @@ def _search_sap_jobs(query: str, location: str) -> list[dict]:
     }
 
     try:
-        resp = requests.get(SEARCH_URL, params=params, headers=headers, timeout=30)
+        resp = SESSION.get(SEARCH_URL, params=params, headers=headers, timeout=30)
         if resp.status_code != 200:
             logger.warning(f"SAP search returned {resp.status_code}")
             return jobs
 
-        soup = BeautifulSoup(resp.text, "html.parser")
+        try:
+            tree = lxml.html.document_fromstring(resp.content)
+        except ParserError:  # empty page
+            return jobs
 
         # Find job rows
-        job_rows = soup.select("tr.data-row")
+        for row in tree.xpath(ROW_XPATH):
+            title_elem = _first(row, TITLE_XPATH)
+            loc_elem = _first(row, LOCATION_XPATH)
+            date_elem = _first(row, DATE_XPATH)
 
-        for row in job_rows:
-            title_elem = row.select_one("a.jobTitle-link")
-            loc_elem = row.select_one("span.jobLocation")
-            date_elem = row.select_one("span.jobDate")
-
-            if not title_elem:
+            if title_elem is None:
                 continue
 
-            title = title_elem.get_text(strip=True)
+            title = _stripped_text(title_elem)
             href = title_elem.get("href", "")
-            location = loc_elem.get_text(strip=True) if loc_elem else ""
-            posted = date_elem.get_text(strip=True) if date_elem else ""
+            location = _stripped_text(loc_elem) if loc_elem is not None else ""
+            posted = _stripped_text(date_elem) if date_elem is not None else ""
 
             # Build full URL
             if href and not href.startswith("http"):
@@ -112,6 +128,17 @@ def _search_sap_jobs(query: str, location: str) -> list[dict]:
     return jobs
 
 
+def _first(element, xpath: str):
+    """Return the first element matching xpath under element, or None."""
+    matches = element.xpath(xpath)
+    return matches[0] if matches else None
+
+
+def _stripped_text(element) -> str:
+    """Join an element's text nodes, each stripped (like BeautifulSoup's get_text(strip=True))."""
+    return "".join(text.strip() for text in element.itertext())
+
+
 def _create_job(company_id: str, job_data: dict) -> Optional[Job]:
     """Create a Job object from scraped data."""
     title = job_data.get("title", "")
@@ -124,9 +151,7 @@ def _create_job(company_id: str, job_data: dict) -> Optional[Job]:
     # Parse posted date (SAP uses formats like "Feb 20, 2026")
     posted_date = _parse_date(job_data.get("posted", ""))
 
-    is_bcn = is_barcelona_role(location, title, "")
-    is_data = is_data_role(title, "")
-    mentions_visa, mentions_relocation = detect_visa_mentions("")
+    is_bcn, is_data, mentions_visa, mentions_relocation = classify_posting(LoweredText.of(title, "", location))
 
     return Job(
         company_id=company_id,
@@ -144,19 +169,5 @@ def _create_job(company_id: str, job_data: dict) -> Optional[Job]:
 
 
 def _parse_date(date_str: str) -> str:
-    """Parse SAP date format to YYYY-MM-DD."""
-    if not date_str:
-        return datetime.now().strftime("%Y-%m-%d")
-
-    try:
-        # Try common formats
-        for fmt in ["%b %d, %Y", "%B %d, %Y", "%Y-%m-%d"]:
-            try:
-                dt = datetime.strptime(date_str.strip(), fmt)
-                return dt.strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-    except Exception:
-        pass
-
-    return datetime.now().strftime("%Y-%m-%d")
+    """Parse SAP date format to YYYY-MM-DD, falling back to today."""
+    return parse_posted_date(date_str) or datetime.now().strftime("%Y-%m-%d")
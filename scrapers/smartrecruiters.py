@@ -1,15 +1,24 @@
 """SmartRecruiters ATS scraper."""
 
+import html
 import logging
+import orjson
+import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from models import Job
-from utils import is_barcelona_role, is_data_role, is_english_posting, detect_visa_mentions
+from utils import LoweredText, classify_posting, is_english_text, is_worth_parsing
+from ._http import cached_request, conditional_get
 
 logger = logging.getLogger(__name__)
 
 SMARTRECRUITERS_API = "https://api.smartrecruiters.com/v1/companies"
+DETAIL_FETCH_WORKERS = 4  # concurrent description requests per company
+
+TAG_RE = re.compile(r'<[^>]+>')
+WHITESPACE_RE = re.compile(r'\s+')
 
 
 def scrape_smartrecruiters(company_id: str, sr_company: str) -> list[Job]:
@@ -27,33 +36,71 @@ def scrape_smartrecruiters(company_id: str, sr_company: str) -> list[Job]:
     url = f"{SMARTRECRUITERS_API}/{sr_company}/postings"
 
     try:
-        response = requests.get(url, timeout=30, headers={
-            'User-Agent': 'Mozilla/5.0 (compatible; JobTracker/1.0)'
-        })
-        response.raise_for_status()
-        data = response.json()
-    except requests.RequestException as e:
+        # Revalidates the last copy of the listing; an unchanged listing costs a 304
+        data = orjson.loads(conditional_get(url))
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
         logger.error(f"Failed to fetch SmartRecruiters jobs for {company_id}: {e}")
         return jobs
 
-    for job_data in data.get('content', []):
-        job = _parse_smartrecruiters_job(company_id, sr_company, job_data)
+    # Cheap title/location check first, so descriptions are only fetched for possible matches
+    postings = [
+        job_data for job_data in data.get('content', [])
+        if is_worth_parsing(job_data.get('name', ''), _format_location(job_data.get('location', {})))
+    ]
+
+    # Each description needs its own request; fetch them concurrently before parsing
+    job_ids = [job_data.get('id', '') for job_data in postings]
+    with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as executor:
+        descriptions = dict(zip(job_ids, executor.map(
+            lambda job_id: _fetch_description(sr_company, job_id), job_ids)))
+
+    for job_data in postings:
+        description = descriptions.get(job_data.get('id', ''), '')
+        job = _parse_smartrecruiters_job(company_id, sr_company, job_data, description)
         if job and job.is_barcelona and job.is_data_role:
             jobs.append(job)
 
-    logger.info(f"SmartRecruiters [{company_id}]: Found {len(jobs)} matching jobs")
+    logger.info("SmartRecruiters [%s]: Found %d matching jobs", company_id, len(jobs))
     return jobs
 
 
-def _parse_smartrecruiters_job(company_id: str, sr_company: str, data: dict) -> Optional[Job]:
-    """Parse a single SmartRecruiters job posting."""
-    title = data.get('name', '')
-
-    # Build location string
-    location_data = data.get('location', {})
+def _fetch_description(sr_company: str, job_id: str) -> str:
+    """Fetch the full description of a posting, or '' if the request fails."""
+    try:
+        detail_url = f"{SMARTRECRUITERS_API}/{sr_company}/postings/{job_id}"
+        # Cached for DETAIL_CACHE_TTL, so unchanged postings aren't downloaded again every run
+        detail_data = orjson.loads(cached_request('GET', detail_url))
+    except (requests.RequestException, orjson.JSONDecodeError):
+        return ''  # Continue without full description
+
+    # SmartRecruiters returns HTML in jobAd.sections; a regex strip is all the
+    # keyword filters need, without building a parse tree per posting
+    # Anything but an object (a list, string or null body, or a null jobAd) carries no description
+    job_ad = detail_data.get('jobAd') if isinstance(detail_data, dict) else None
+    sections = job_ad.get('sections') if isinstance(job_ad, dict) else None
+    if not isinstance(sections, dict):
+        return ''
+    description_parts = []
+    for section_name in ['jobDescription', 'qualifications', 'additionalInformation']:
+        section = sections.get(section_name)
+        if isinstance(section, dict) and section.get('text'):
+            text = WHITESPACE_RE.sub(' ', html.unescape(TAG_RE.sub(' ', section['text']))).strip()
+            description_parts.append(text)
+    return ' '.join(description_parts)
+
+
+def _format_location(location_data: dict) -> str:
+    """Build a "City, Country" location string from a posting's location object."""
     city = location_data.get('city', '')
     country = location_data.get('country', '')
-    location = f"{city}, {country}".strip(', ')
+    return f"{city}, {country}".strip(', ')
+
+
+def _parse_smartrecruiters_job(company_id: str, sr_company: str, data: dict, description: str) -> Optional[Job]:
+    """Parse a single SmartRecruiters job posting, given its prefetched description."""
+    title = data.get('name', '')
+
+    location = _format_location(data.get('location', {}))
 
     department = data.get('department', {}).get('label', '')
     job_id = data.get('id', '')
@@ -62,33 +109,14 @@ def _parse_smartrecruiters_job(company_id: str, sr_company: str, data: dict) ->
     # Construct application URL
     url = f"https://jobs.smartrecruiters.com/{sr_company}/{job_id}"
 
-    # Fetch full job description
-    description = ''
-    try:
-        detail_url = f"{SMARTRECRUITERS_API}/{sr_company}/postings/{job_id}"
-        response = requests.get(detail_url, timeout=30, headers={
-            'User-Agent': 'Mozilla/5.0 (compatible; JobTracker/1.0)'
-        })
-        if response.ok:
-            detail_data = response.json()
-            # SmartRecruiters returns HTML in jobAd.sections
-            sections = detail_data.get('jobAd', {}).get('sections', {})
-            description_parts = []
-            for section_name in ['jobDescription', 'qualifications', 'additionalInformation']:
-                section = sections.get(section_name, {})
-                if section.get('text'):
-                    description_parts.append(section['text'])
-            description = ' '.join(description_parts)
-    except requests.RequestException:
-        pass  # Continue without full description
+    # Lowercased once and shared by the language and classification checks
+    lowered = LoweredText.of(title, description, location)
 
     # Filter: must be English
-    if not is_english_posting(title, description):
+    if not is_english_text(lowered):
         return None
 
-    is_bcn = is_barcelona_role(location, title, description)
-    is_data = is_data_role(title, description)
-    mentions_visa, mentions_relocation = detect_visa_mentions(description)
+    is_bcn, is_data, mentions_visa, mentions_relocation = classify_posting(lowered)
 
     # Parse posted date
     posted_date = data.get('releasedDate', '')[:10] if data.get('releasedDate') else None
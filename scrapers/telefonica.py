@@ -7,13 +7,23 @@ from bs4 import BeautifulSoup
 from typing import Optional
 
 from models import Job
-from utils import is_barcelona_role, is_data_role, is_english_posting, detect_visa_mentions
+from utils import LoweredText, classify_posting, is_worth_parsing, parse_posted_date
+from ._http import SESSION, cached_request
 
 logger = logging.getLogger(__name__)
 
 TELEFONICA_BASE = "https://jobs.telefonica.com"
 TELEFONICA_SEARCH = f"{TELEFONICA_BASE}/search/"
 
+# Link and class/id matchers for the listing and detail pages, compiled once at import
+JOB_URL_RE = re.compile(r"/job/.*?/\d+/")
+JOB_LINK_RE = re.compile(r"/job/")
+ROW_CLASS_RE = re.compile(r"job|result|row")
+LOCATION_CLASS_RE = re.compile(r"location|city")
+DATE_CLASS_RE = re.compile(r"date|posted")
+DESCRIPTION_CLASS_RE = re.compile(r"job-description|jobDescription|description")
+DESCRIPTION_ID_RE = re.compile(r"description|job-details")
+
 
 def scrape_telefonica(company_id: str, location: str = "barcelona") -> list[Job]:
     """
@@ -36,25 +46,20 @@ def scrape_telefonica(company_id: str, location: str = "barcelona") -> list[Job]
     }
 
     try:
-        response = requests.get(
-            TELEFONICA_SEARCH,
-            params=params,
-            timeout=30,
-            headers={"User-Agent": "Mozilla/5.0 (compatible; JobTracker/1.0)"},
-        )
+        response = SESSION.get(TELEFONICA_SEARCH, params=params, timeout=30)
         response.raise_for_status()
     except requests.RequestException as e:
         logger.error(f"Failed to fetch Telefónica jobs for {company_id}: {e}")
         return jobs
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    soup = BeautifulSoup(response.text, "lxml")
 
     # Find job listings - they're typically in a results container
     job_elements = soup.select("tr.data-row") or soup.select(".job-row") or soup.select("[data-job-id]")
 
     # Alternative: look for links that match job URL pattern
     if not job_elements:
-        job_links = soup.find_all("a", href=re.compile(r"/job/.*?/\d+/"))
+        job_links = soup.find_all("a", href=JOB_URL_RE)
         for link in job_links:
             job = _parse_telefonica_job_from_link(company_id, link, soup)
             if job and job.is_barcelona and job.is_data_role:
@@ -65,15 +70,13 @@ def scrape_telefonica(company_id: str, location: str = "barcelona") -> list[Job]
             if job and job.is_barcelona and job.is_data_role:
                 jobs.append(job)
 
-    # Deduplicate by URL
-    seen_urls = set()
-    unique_jobs = []
+    # Deduplicate by URL, keeping the first copy of each
+    first_by_url = {}
     for job in jobs:
-        if job.job_url not in seen_urls:
-            seen_urls.add(job.job_url)
-            unique_jobs.append(job)
+        first_by_url.setdefault(job.job_url, job)
+    unique_jobs = list(first_by_url.values())
 
-    logger.info(f"Telefónica [{company_id}]: Found {len(unique_jobs)} matching jobs")
+    logger.info("Telefónica [%s]: Found %d matching jobs", company_id, len(unique_jobs))
     return unique_jobs
 
 
@@ -90,18 +93,18 @@ def _parse_telefonica_job_from_link(company_id: str, link_elem, soup: BeautifulS
         return None
 
     # Try to find location near the link
-    parent = link_elem.find_parent("tr") or link_elem.find_parent("div", class_=re.compile(r"job|result|row"))
+    parent = link_elem.find_parent("tr") or link_elem.find_parent("div", class_=ROW_CLASS_RE)
     location = ""
     posted_date = None
 
     if parent:
         # Look for location text
-        loc_elem = parent.find(class_=re.compile(r"location|city")) or parent.find("span", class_="job-location")
+        loc_elem = parent.find(class_=LOCATION_CLASS_RE) or parent.find("span", class_="job-location")
         if loc_elem:
             location = loc_elem.get_text(strip=True)
 
         # Look for date
-        date_elem = parent.find(class_=re.compile(r"date|posted"))
+        date_elem = parent.find(class_=DATE_CLASS_RE)
         if date_elem:
             date_text = date_elem.get_text(strip=True)
             posted_date = _parse_date(date_text)
@@ -113,13 +116,15 @@ def _parse_telefonica_job_from_link(company_id: str, link_elem, soup: BeautifulS
         else:
             location = "Spain"
 
+    # Cheap title/location check before paying for the detail page
+    if not is_worth_parsing(title, location):
+        return None
+
     # Fetch job details page for description
     description = _fetch_job_description(url)
 
     # Filter: check if English (or Spanish for Telefonica)
-    is_bcn = is_barcelona_role(location, title, description)
-    is_data = is_data_role(title, description)
-    mentions_visa, mentions_relocation = detect_visa_mentions(description)
+    is_bcn, is_data, mentions_visa, mentions_relocation = classify_posting(LoweredText.of(title, description, location))
 
     return Job(
         company_id=company_id,
@@ -139,7 +144,7 @@ def _parse_telefonica_job_from_link(company_id: str, link_elem, soup: BeautifulS
 def _parse_telefonica_job_element(company_id: str, elem) -> Optional[Job]:
     """Parse a job from a table row or div element."""
     # Find the job link
-    link = elem.find("a", href=re.compile(r"/job/"))
+    link = elem.find("a", href=JOB_LINK_RE)
     if not link:
         return None
 
@@ -149,22 +154,24 @@ def _parse_telefonica_job_element(company_id: str, elem) -> Optional[Job]:
 
     # Find location
     location = ""
-    loc_elem = elem.find(class_=re.compile(r"location|city"))
+    loc_elem = elem.find(class_=LOCATION_CLASS_RE)
     if loc_elem:
         location = loc_elem.get_text(strip=True)
 
     # Find date
     posted_date = None
-    date_elem = elem.find(class_=re.compile(r"date|posted"))
+    date_elem = elem.find(class_=DATE_CLASS_RE)
     if date_elem:
         date_text = date_elem.get_text(strip=True)
         posted_date = _parse_date(date_text)
 
+    # Cheap title/location check before paying for the detail page
+    if not is_worth_parsing(title, location):
+        return None
+
     description = _fetch_job_description(url)
 
-    is_bcn = is_barcelona_role(location, title, description)
-    is_data = is_data_role(title, description)
-    mentions_visa, mentions_relocation = detect_visa_mentions(description)
+    is_bcn, is_data, mentions_visa, mentions_relocation = classify_posting(LoweredText.of(title, description, location))
 
     return Job(
         company_id=company_id,
@@ -184,18 +191,13 @@ def _parse_telefonica_job_element(company_id: str, elem) -> Optional[Job]:
 def _fetch_job_description(url: str) -> str:
     """Fetch the full job description from a job detail page."""
     try:
-        response = requests.get(
-            url,
-            timeout=15,
-            headers={"User-Agent": "Mozilla/5.0 (compatible; JobTracker/1.0)"},
-        )
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        # Cached for DETAIL_CACHE_TTL, so unchanged postings aren't downloaded again every run
+        soup = BeautifulSoup(cached_request("GET", url, timeout=15), "lxml")
 
         # Look for job description container
         desc_elem = (
-            soup.find(class_=re.compile(r"job-description|jobDescription|description"))
-            or soup.find("div", {"id": re.compile(r"description|job-details")})
+            soup.find(class_=DESCRIPTION_CLASS_RE)
+            or soup.find("div", {"id": DESCRIPTION_ID_RE})
             or soup.find("article")
         )
 
@@ -207,25 +209,5 @@ def _fetch_job_description(url: str) -> str:
 
 
 def _parse_date(date_text: str) -> Optional[str]:
-    """Parse date from various formats to YYYY-MM-DD."""
-    if not date_text:
-        return None
-
-    # Common formats: "26 Nov 2025", "15 Jan 2026", "January 15, 2026"
-    from datetime import datetime
-
-    formats = [
-        "%d %b %Y",      # 26 Nov 2025
-        "%d %B %Y",      # 26 November 2025
-        "%B %d, %Y",     # November 26, 2025
-        "%Y-%m-%d",      # 2025-11-26
-    ]
-
-    for fmt in formats:
-        try:
-            dt = datetime.strptime(date_text.strip(), fmt)
-            return dt.strftime("%Y-%m-%d")
-        except ValueError:
-            continue
-
-    return None
+    """Parse date from various formats ("26 Nov 2025", "January 15, 2026", ...) to YYYY-MM-DD."""
+    return parse_posted_date(date_text)
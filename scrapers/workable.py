@@ -1,15 +1,19 @@
 """Workable ATS scraper."""
 
 import logging
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from models import Job
-from utils import is_barcelona_role, is_data_role, is_english_posting, detect_visa_mentions
+from utils import LoweredText, classify_posting, is_english_text, is_worth_parsing
+from ._http import SESSION, cached_request
 
 logger = logging.getLogger(__name__)
 
 WORKABLE_API_BASE = "https://apply.workable.com/api/v3/accounts"
+DETAIL_FETCH_WORKERS = 4  # concurrent description requests per company
 
 
 def scrape_workable(company_id: str, workable_subdomain: str) -> list[Job]:
@@ -27,35 +31,60 @@ def scrape_workable(company_id: str, workable_subdomain: str) -> list[Job]:
     url = f"{WORKABLE_API_BASE}/{workable_subdomain}/jobs"
 
     try:
-        response = requests.post(url, json={}, timeout=30, headers={
-            'User-Agent': 'Mozilla/5.0 (compatible; JobTracker/1.0)',
-            'Content-Type': 'application/json',
-        })
+        response = SESSION.post(url, json={}, timeout=30)
         response.raise_for_status()
-        data = response.json()
-    except requests.RequestException as e:
+        data = orjson.loads(response.content)
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
         logger.error(f"Failed to fetch Workable jobs for {company_id}: {e}")
         return jobs
 
-    for job_data in data.get('results', []):
-        # Fetch full job details for description
-        job = _fetch_and_parse_workable_job(company_id, workable_subdomain, job_data)
+    # Cheap title/location check first, so descriptions are only fetched for possible matches
+    postings = [
+        job_data for job_data in data.get('results', [])
+        if is_worth_parsing(job_data.get('title', ''), _format_location(job_data.get('location', {})))
+    ]
+
+    # Each description needs its own request; fetch them concurrently before parsing
+    shortcodes = [job_data.get('shortcode', '') for job_data in postings]
+    with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as executor:
+        descriptions = dict(zip(shortcodes, executor.map(
+            lambda shortcode: _fetch_description(workable_subdomain, shortcode), shortcodes)))
+
+    for job_data in postings:
+        description = descriptions.get(job_data.get('shortcode', ''), '')
+        job = _parse_workable_job(company_id, workable_subdomain, job_data, description)
         if job and job.is_barcelona and job.is_data_role:
             jobs.append(job)
 
-    logger.info(f"Workable [{company_id}]: Found {len(jobs)} matching jobs")
+    logger.info("Workable [%s]: Found %d matching jobs", company_id, len(jobs))
     return jobs
 
 
-def _fetch_and_parse_workable_job(company_id: str, subdomain: str, data: dict) -> Optional[Job]:
-    """Fetch full details and parse a single Workable job posting."""
+def _fetch_description(subdomain: str, shortcode: str) -> str:
+    """Fetch the full description of a posting, or '' if the request fails."""
+    try:
+        detail_url = f"{WORKABLE_API_BASE}/{subdomain}/jobs/{shortcode}"
+        # Cached for DETAIL_CACHE_TTL, so unchanged postings aren't downloaded again every run
+        detail_data = orjson.loads(cached_request('POST', detail_url, json={}))
+    except (requests.RequestException, orjson.JSONDecodeError):
+        return ''  # Continue without full description
+
+    # Anything but an object (a list, string or null body) carries no description
+    return detail_data.get('description', '') if isinstance(detail_data, dict) else ''
+
+
+def _format_location(location_data) -> str:
+    """Build a location string from a posting's location, which is either an object or a string."""
+    if isinstance(location_data, dict):
+        return f"{location_data.get('city', '')}, {location_data.get('country', '')}".strip(', ')
+    return str(location_data) if location_data else ''
+
+
+def _parse_workable_job(company_id: str, subdomain: str, data: dict, description: str) -> Optional[Job]:
+    """Parse a single Workable job posting, given its prefetched description."""
     shortcode = data.get('shortcode', '')
     title = data.get('title', '')
-    location_data = data.get('location', {})
-    if isinstance(location_data, dict):
-        location = f"{location_data.get('city', '')}, {location_data.get('country', '')}".strip(', ')
-    else:
-        location = str(location_data) if location_data else ''
+    location = _format_location(data.get('location', {}))
     department = data.get('department', '')
     if isinstance(department, list):
         department = ', '.join(str(d) for d in department)
@@ -66,27 +95,14 @@ def _fetch_and_parse_workable_job(company_id: str, subdomain: str, data: dict) -
     else:
         posted_date = None
 
-    # Fetch full job description
-    description = ''
-    try:
-        detail_url = f"{WORKABLE_API_BASE}/{subdomain}/jobs/{shortcode}"
-        response = requests.post(detail_url, json={}, timeout=30, headers={
-            'User-Agent': 'Mozilla/5.0 (compatible; JobTracker/1.0)',
-            'Content-Type': 'application/json',
-        })
-        if response.ok:
-            detail_data = response.json()
-            description = detail_data.get('description', '')
-    except requests.RequestException:
-        pass  # Continue without full description
+    # Lowercased once and shared by the language and classification checks
+    lowered = LoweredText.of(title, description, location)
 
     # Filter: must be English
-    if not is_english_posting(title, description):
+    if not is_english_text(lowered):
         return None
 
-    is_bcn = is_barcelona_role(location, title, description)
-    is_data = is_data_role(title, description)
-    mentions_visa, mentions_relocation = detect_visa_mentions(description)
+    is_bcn, is_data, mentions_visa, mentions_relocation = classify_posting(lowered)
 
     return Job(
         company_id=company_id,
@@ -2,13 +2,17 @@
 
 import logging
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from itertools import chain
 from typing import Optional
 
+import orjson
 import requests
 
 from models import Job
-from utils import is_barcelona_role, is_data_role, detect_visa_mentions
+from utils import LoweredText, classify_posting
+from ._http import SESSION, cached_request
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +26,23 @@ WORKDAY_COMPANIES = {
     "clarivate":  ("clarivate",  "wd3",   "Clarivate_Careers",       "Barcelona"),
 }
 
+# Optional server-side location filters, sent as the listing's appliedFacets
+# Format: company_id -> {facet_parameter: [facet value ids]}
+# e.g. {"locationCountry": ["<Spain id>"]}, using the ids from the site's own facet
+#   list (the "facets" array of a listing response). A tenant filtered this way
+#   returns only its Spain/Barcelona postings, so a scrape needs a page or two.
+#   Companies without an entry fetch unfiltered (narrowed by search_text only).
+WORKDAY_LOCATION_FACETS: dict[str, dict[str, list[str]]] = {}
+
+# Workday serves its career sites to browsers, so requests carry a browser User-Agent
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+CSRF_COOKIE = "CALYPSO_CSRF_TOKEN"
+
+PAGE_SIZE = 20  # Workday rejects larger limits
+MAX_JOBS = 500  # Fetch enough to find data roles
+PAGE_FETCH_WORKERS = 4  # concurrent page requests per company (the session allows 4 per host)
+LISTING_CACHE_TTL = timedelta(minutes=30)  # reruns within this window reuse the listing pages
+
 
 def scrape_workday(company_id: str) -> list[Job]:
     """
@@ -38,81 +59,60 @@ def scrape_workday(company_id: str) -> list[Job]:
         return []
 
     tenant, wd_instance, site_id, search_text = WORKDAY_COMPANIES[company_id]
-    base_url = f"https://{tenant}.{wd_instance}.myworkdayjobs.com"
+    applied_facets = WORKDAY_LOCATION_FACETS.get(company_id, {})
+    host = f"{tenant}.{wd_instance}.myworkdayjobs.com"
+    base_url = f"https://{host}"
 
     try:
-        # Create session and get CSRF token
-        session = requests.Session()
-        session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        })
-
-        # Get main page to establish session
+        # Get main page to establish the session cookies and CSRF token. The shared
+        # session keeps its connections open across companies.
         main_url = f"{base_url}/en-US/{site_id}"
-        resp = session.get(main_url, timeout=30)
+        resp = SESSION.get(main_url, headers={"User-Agent": USER_AGENT}, timeout=30)
         if resp.status_code != 200:
             logger.error(f"Failed to load Workday main page for {company_id}: {resp.status_code}")
             return []
 
-        csrf_token = session.cookies.get("CALYPSO_CSRF_TOKEN")
+        # The cookie jar is shared by every tenant, so look the token up for this host only
+        csrf_token = resp.cookies.get(CSRF_COOKIE) or SESSION.cookies.get(CSRF_COOKIE, domain=host)
         if not csrf_token:
             logger.warning(f"No CSRF token found for {company_id}, trying without")
 
-        # Fetch all jobs with pagination
-        all_jobs = []
-        offset = 0
-        limit = 20  # Workday rejects larger limits
-        max_jobs = 500  # Fetch enough to find data roles
-        total_jobs = None  # Will be set from first response
-
         api_url = f"{base_url}/wday/cxs/{tenant}/{site_id}/jobs"
         headers = {
+            "User-Agent": USER_AGENT,
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
         if csrf_token:
             headers["X-CALYPSO-CSRF-TOKEN"] = csrf_token
 
-        while offset < max_jobs:
-            body = {
-                "appliedFacets": {},
-                "limit": limit,
-                "offset": offset,
-                "searchText": search_text,
-            }
-
-            resp = session.post(api_url, headers=headers, json=body, timeout=30)
-
-            if resp.status_code != 200:
-                logger.error(f"Workday API error for {company_id}: {resp.status_code}")
-                break
+        def fetch_page(offset: int) -> Optional[dict]:
+            return _fetch_page(company_id, api_url, headers, search_text, applied_facets, offset)
 
-            data = resp.json()
-            jobs = data.get("jobPostings", [])
+        # Only first response has accurate total, and it tells us which other pages exist
+        first_page = fetch_page(0)
+        total_jobs = first_page.get("total", 0) if first_page else 0
 
-            # Only first response has accurate total
-            if total_jobs is None:
-                total_jobs = data.get("total", 0)
-
-            if not jobs:
-                break
-
-            all_jobs.extend(jobs)
-            logger.debug(f"Fetched {len(all_jobs)}/{total_jobs} jobs for {company_id}")
-
-            if len(all_jobs) >= total_jobs:
-                break
-
-            offset += limit
-
-        # Filter and convert to Job objects
+        # The remaining pages are independent, so request them concurrently and
+        # filter each one as it arrives (in offset order)
         matching_jobs = []
-        for job_data in all_jobs:
-            job = _parse_workday_job(company_id, job_data, base_url, site_id)
-            if job and job.is_barcelona and job.is_data_role:
-                matching_jobs.append(job)
-
-        logger.info(f"Workday [{company_id}]: Found {len(matching_jobs)} matching jobs from {len(all_jobs)} total")
+        fetched = 0
+        today = datetime.now().strftime("%Y-%m-%d")  # posted date for every job of this scrape
+        with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
+            later_pages = executor.map(fetch_page, range(PAGE_SIZE, min(total_jobs, MAX_JOBS), PAGE_SIZE))
+            for page in chain([first_page], later_pages):
+                if not page:
+                    continue
+                jobs = page.get("jobPostings", [])
+                fetched += len(jobs)
+                logger.debug("Fetched %d/%s jobs for %s", fetched, total_jobs, company_id)
+
+                for job_data in jobs:
+                    job = _parse_workday_job(company_id, job_data, base_url, site_id, today)
+                    if job:
+                        matching_jobs.append(job)
+
+        logger.info("Workday [%s]: Found %d matching jobs from %d total", company_id, len(matching_jobs), fetched)
         return matching_jobs
 
     except requests.RequestException as e:
@@ -123,17 +123,34 @@ def scrape_workday(company_id: str) -> list[Job]:
         return []
 
 
-def _parse_workday_job(company_id: str, job_data: dict, base_url: str, site_id: str) -> Optional[Job]:
-    """Parse a Workday job posting into a Job object."""
+def _fetch_page(company_id: str, api_url: str, headers: dict, search_text: str,
+                applied_facets: dict, offset: int) -> Optional[dict]:
+    """Fetch one page of the job listing, or None if the request fails."""
+    body = {
+        "appliedFacets": applied_facets,
+        "limit": PAGE_SIZE,
+        "offset": offset,
+        "searchText": search_text,
+    }
+
+    try:
+        # Keyed on the URL and body only, so the CSRF header doesn't defeat the cache
+        content = cached_request("POST", api_url, json=body, headers=headers, max_age=LISTING_CACHE_TTL)
+    except requests.RequestException as e:
+        logger.error(f"Workday API error for {company_id}: {e}")
+        return None
+
+    return orjson.loads(content)
+
+
+def _parse_workday_job(company_id: str, job_data: dict, base_url: str, site_id: str, today: str) -> Optional[Job]:
+    """Parse a Workday job posting into a Job object, or None unless it's a Barcelona data role."""
     title = job_data.get("title", "")
     external_path = job_data.get("externalPath", "")
 
     if not title or not external_path:
         return None
 
-    # Build full URL
-    job_url = f"{base_url}/en-US/{site_id}{external_path}"
-
     # Extract location: prefer locationsText (available on newer WD instances),
     # fall back to bulletFields (Mango-style: [city, region, ...])
     locations_text = job_data.get("locationsText", "")
@@ -158,12 +175,16 @@ def _parse_workday_job(company_id: str, job_data: dict, base_url: str, site_id:
     # Time type (Full time, Part time, etc.)
     time_type = job_data.get("timeType", "")
 
-    # Check Barcelona/data role
-    is_bcn = is_barcelona_role(location, title, "")
-    is_data = is_data_role(title, "")
+    # Check Barcelona/data role. No description is available from the list
+    # endpoint, so the visa/relocation flags always come back False
+    is_bcn, is_data, mentions_visa, mentions_relocation = classify_posting(LoweredText.of(title, "", location))
+
+    # Most postings fail here, so skip building the URL and Job for them
+    if not (is_bcn and is_data):
+        return None
 
-    # No description available from list endpoint
-    mentions_visa, mentions_relocation = False, False
+    # Build full URL
+    job_url = f"{base_url}/en-US/{site_id}{external_path}"
 
     return Job(
         company_id=company_id,
@@ -171,7 +192,7 @@ def _parse_workday_job(company_id: str, job_data: dict, base_url: str, site_id:
         job_url=job_url,
         location=location,
         department="",
-        posted_date=datetime.now().strftime("%Y-%m-%d"),  # Workday doesn't show post date in list
+        posted_date=today,  # Workday doesn't show post date in list
         description_full="",
         is_barcelona=is_bcn,
         is_data_role=is_data,
@@ -7,10 +7,9 @@ from datetime import datetime
 from email.utils import parsedate_to_datetime
 from typing import Optional
 
-import requests
-
 from models import Job
-from utils import is_barcelona_role, is_data_role, detect_visa_mentions
+from utils import LoweredText, classify_posting
+from ._http import SESSION
 
 logger = logging.getLogger(__name__)
 
@@ -81,7 +80,7 @@ def _fetch_rss_jobs(term: str, headers: dict) -> list[dict]:
         "keywords": term,
     }
 
-    resp = requests.get(RSS_URL, params=params, headers=headers, timeout=30)
+    resp = SESSION.get(RSS_URL, params=params, headers=headers, timeout=30)
     if resp.status_code != 200:
         logger.warning(f"Zurich RSS returned {resp.status_code} for term '{term}'")
         return []
@@ -180,9 +179,7 @@ def _create_job(company_id: str, job_data: dict) -> Optional[Job]:
     if not title or not url:
         return None
 
-    is_bcn = is_barcelona_role(location, title, description)
-    is_data = is_data_role(title, description)
-    mentions_visa, mentions_relocation = detect_visa_mentions(description)
+    is_bcn, is_data, mentions_visa, mentions_relocation = classify_posting(LoweredText.of(title, description, location))
 
     return Job(
         company_id=company_id,
@@ -1,8 +1,21 @@
 """Utility functions for job filtering and detection."""
 
 import re
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
 from typing import Optional
 
+try:
+    import ahocorasick
+except ImportError:  # optional C extension; the compiled alternations below are the fallback
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:  # optional google-re2 binding; stdlib re compiles the same patterns
+    re2 = None
+
 
 # Barcelona location patterns
 BARCELONA_PATTERNS = [
@@ -18,6 +31,9 @@ BARCELONA_PATTERNS = [
     r'\bcatalun',  # Catalonia/Catalunya
 ]
 
+# Every Barcelona pattern contains one of these words whole, so text without any of them can't match
+BARCELONA_LITERALS = ['barcelona', 'bcn', 'spain', 'palau', 'cugat', 'españa', 'catalun']
+
 # Data role keywords (broad for high recall)
 DATA_ROLE_KEYWORDS = [
     'data scientist',
@@ -54,7 +70,8 @@ GREAT_FIT_KEYWORDS = [
     'artificial intelligence',
 ]
 
-# Keywords that disqualify a role from being a "great fit"
+# Keywords that disqualify a role from being a "great fit". Single words only match
+# whole title words (so 'intern' doesn't catch "Internal Tools"); phrases match anywhere.
 GREAT_FIT_EXCLUSIONS = [
     'intern',
     'internship',
@@ -73,12 +90,12 @@ GREAT_FIT_EXCLUSIONS = [
     'sales',
     'marketing',
     'recruiter',
-    'hr ',
+    'hr',
     'human resources',
     'content',
     'designer',
-    'ux ',
-    'ui ',
+    'ux',
+    'ui',
     'customer success',
     'support engineer',
     'qa engineer',
@@ -127,21 +144,158 @@ NON_ENGLISH_PATTERNS = [
     r'\bfeina\b',    # Catalan
 ]
 
+# Spanish/Catalan accented letters mapped to plain ASCII. The non-English check runs on
+# folded text, so its patterns only need plain letters and also match unaccented spellings.
+ACCENT_FOLD = str.maketrans('áéíóúñüàèìòùç', 'aeiounuaeiouc')
+
+# Description signals strong enough to make a role a great fit when the title isn't
+GREAT_FIT_DESCRIPTION_SIGNALS = ['data scientist', 'machine learning engineer', 'ml engineer', 'data analyst']
+
+# Lowercase words of a title, for whole-word keyword checks
+WORD_RE = re.compile(r'[a-z]+')
+
+
+def _compile_filter(pattern: str) -> re.Pattern:
+    """
+    Compile a filter regex with google-re2 when it's installed, else with re.
+    RE2 runs in linear time without backtracking, which matters for the
+    '.*' proximity patterns on long descriptions.
+    """
+    return (re2 or re).compile(pattern)
+
+
+# Each pattern list compiled once into a single alternation, so a check is one search call.
+# Like the keyword lists they're only ever run on LoweredText fields, so they're compiled
+# case-sensitive rather than making the engine case-fold every character of the text.
+BARCELONA_RE = _compile_filter('|'.join(BARCELONA_PATTERNS))
+NON_ENGLISH_RE = _compile_filter('|'.join(NON_ENGLISH_PATTERNS).translate(ACCENT_FOLD))
+
+# Great-fit title checks: single words by set lookup on the title's words, phrases by substring scan
+GREAT_FIT_WORDS = frozenset(kw for kw in GREAT_FIT_KEYWORDS if ' ' not in kw)
+GREAT_FIT_EXCLUSION_WORDS = frozenset(kw for kw in GREAT_FIT_EXCLUSIONS if ' ' not in kw)
+
+# Every substring keyword list under its own tag, so one scan of a field reports hits from
+# all of them. Keyword lists are matched against lowercased text, so this is case-sensitive.
+KEYWORD_TAGS = {
+    'barcelona': BARCELONA_LITERALS,
+    'data': DATA_ROLE_KEYWORDS,
+    'great_fit': [kw for kw in GREAT_FIT_KEYWORDS if ' ' in kw],
+    'exclusion': [kw for kw in GREAT_FIT_EXCLUSIONS if ' ' in kw],
+    'signal': GREAT_FIT_DESCRIPTION_SIGNALS,
+    'visa': VISA_KEYWORDS,
+    'relocation': RELOCATION_KEYWORDS,
+}
+
+
+def _keyword_automaton(tagged_keywords: dict[str, list[str]]):
+    """Build an Aho-Corasick automaton whose matches yield the tags of the keyword found."""
+    tags_by_keyword: dict[str, list[str]] = {}
+    for tag, keywords in tagged_keywords.items():
+        for keyword in keywords:
+            tags_by_keyword.setdefault(keyword, []).append(tag)  # e.g. 'ml engineer' is in several lists
+
+    automaton = ahocorasick.Automaton()
+    for keyword, tags in tags_by_keyword.items():
+        automaton.add_word(keyword, tuple(tags))
+    automaton.make_automaton()
+    return automaton
+
+
+# With pyahocorasick installed, one linear pass finds every tag however many keywords
+# there are; otherwise each tag's keywords are searched as one escaped alternation
+KEYWORD_AUTOMATON = _keyword_automaton(KEYWORD_TAGS) if ahocorasick is not None else None
+KEYWORD_RES = {} if ahocorasick is not None else {
+    tag: _compile_filter('|'.join(map(re.escape, keywords))) for tag, keywords in KEYWORD_TAGS.items()
+}
+
+
+def _scan(text: str) -> set[str]:
+    """Return the KEYWORD_TAGS tags with at least one keyword in the (lowercased) text."""
+    if KEYWORD_AUTOMATON is None:
+        return {tag for tag, pattern in KEYWORD_RES.items() if pattern.search(text)}
+
+    tags = set()
+    for _, keyword_tags in KEYWORD_AUTOMATON.iter(text):
+        tags.update(keyword_tags)
+    return tags
+
+
+# Results kept per distinct arguments by the public filter checks. Titles recur across
+# sites and pages (and the title-only checks see nothing else), so repeats are a dict lookup.
+FILTER_CACHE_SIZE = 4096
+
+# Location substrings that keep a posting in play for the title/location prefilter
+LOCATION_HINTS = ['barcelona', 'spain', 'españa', 'remote', 'bcn', 'catalu']
+
+# Month names and abbreviations for parse_posted_date
+_MONTH_NAMES = ('january', 'february', 'march', 'april', 'may', 'june', 'july',
+                'august', 'september', 'october', 'november', 'december')
+MONTHS = {
+    **{name: number for number, name in enumerate(_MONTH_NAMES, start=1)},
+    **{name[:3]: number for number, name in enumerate(_MONTH_NAMES, start=1)},
+}
+
+# Posted date formats seen on careers pages: "26 Nov 2025" / "26 November 2025",
+# "Nov 26, 2025" / "November 26, 2025", and "2025-11-26"
+POSTED_DATE_RE = re.compile(
+    r'(?P<dmy_day>\d{1,2})\s+(?P<dmy_month>[A-Za-z]+)\s+(?P<dmy_year>\d{4})'
+    r'|(?P<mdy_month>[A-Za-z]+)\s+(?P<mdy_day>\d{1,2}),\s*(?P<mdy_year>\d{4})'
+    r'|(?P<iso_year>\d{4})-(?P<iso_month>\d{1,2})-(?P<iso_day>\d{1,2})'
+)
+
+# Work type indicators, compiled once so each job is scanned in a single pass
+REMOTE_KEYWORDS = ['remote', 'work from home', 'wfh', 'fully remote', '100% remote']
+HYBRID_KEYWORDS = ['hybrid', 'flexible', '2 days', '3 days', 'days in office', 'days per week']
+REMOTE_RE = re.compile('|'.join(map(re.escape, REMOTE_KEYWORDS)), re.IGNORECASE)
+HYBRID_RE = re.compile('|'.join(map(re.escape, HYBRID_KEYWORDS)), re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class LoweredText:
+    """
+    Lowercased copies of a posting's fields, made once per posting and shared by
+    every filter, so no check lowercases (or re-copies) the description again.
+    """
+    title: str
+    desc: str = ''
+    location: str = ''
+
+    @classmethod
+    def of(cls, title: str, description: Optional[str] = '', location: Optional[str] = '') -> 'LoweredText':
+        """Lowercase a posting's title, description and location."""
+        return cls(title.lower(), (description or '').lower(), (location or '').lower())
 
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
 def is_barcelona_role(location: Optional[str], title: str, description: str) -> bool:
     """
     Check if job is Barcelona-based.
     Handles: "Barcelona", "Barcelona, Spain", "Remote - Spain", "Hybrid - Barcelona"
     """
-    text = f"{location or ''} {title} {description}".lower()
+    return _matches_barcelona(LoweredText.of(title, description, location))
+
+
+def _matches_barcelona(lowered: LoweredText, tags: Optional[set[str]] = None) -> bool:
+    """
+    Barcelona check on a lowered posting (BARCELONA_RE assumes lowercase text).
+    tags, if given, are the _scan tags of all three fields.
+    """
+    # The location is short and usually settles it on its own
+    if BARCELONA_RE.search(lowered.location):
+        return True
 
-    for pattern in BARCELONA_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
+    # Plain substring scans rule out most other postings without running the regex
+    if tags is None:
+        tags = _scan(lowered.location) | _scan(lowered.title) | _scan(lowered.desc)
+    if 'barcelona' not in tags:
+        return False
 
-    return False
+    # Proximity patterns like "remote ... spain" may span fields, so the regex
+    # still searches the fields joined together
+    return BARCELONA_RE.search(f"{lowered.location} {lowered.title} {lowered.desc}") is not None
 
 
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
 def is_data_role(title: str, description: str) -> bool:
     """
     Check if job is data-related (broad filter for high recall).
@@ -149,43 +303,60 @@ def is_data_role(title: str, description: str) -> bool:
               AI Engineer, Analytics Engineer, Machine Learning, Applied Scientist
     Bias toward inclusion - accept false positives to avoid missing opportunities.
     """
-    text = f"{title} {description}".lower()
+    return _matches_data_role(LoweredText.of(title, description))
+
 
-    for keyword in DATA_ROLE_KEYWORDS:
-        if keyword in text:
-            return True
+def _matches_data_role(lowered: LoweredText) -> bool:
+    """Data role check on a lowered posting; the title is tried before the description."""
+    return 'data' in _scan(lowered.title) or 'data' in _scan(lowered.desc)
 
-    return False
+
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def is_worth_parsing(title: str, location: Optional[str]) -> bool:
+    """
+    Cheap title/location-only prefilter, run before any description scan.
+    Returns False when the title isn't a data role and the location gives no hint of
+    Barcelona, Spain or remote work, so the posting can be dropped without touching
+    its (often multi-KB) description.
+    """
+    lowered = LoweredText.of(title, "", location)
+    if _matches_data_role(lowered):
+        return True
+    if _matches_barcelona(lowered):
+        return True
+    return any(hint in lowered.location for hint in LOCATION_HINTS)
 
 
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
 def is_great_fit(title: str, description: str = "") -> bool:
     """
     Check if job is a great fit (core DS/ML/AI role).
     More strict than is_data_role - excludes internships, PMs, SWEs, etc.
     Based primarily on title, with description as tiebreaker.
     """
-    title_lower = title.lower()
+    return _is_great_fit(LoweredText.of(title, description))
+
+
+def _is_great_fit(lowered: LoweredText, title_tags: Optional[set[str]] = None,
+                  desc_tags: Optional[set[str]] = None) -> bool:
+    """Great fit check on a lowered posting, reusing the fields' _scan tags when given."""
+    title_words = set(WORD_RE.findall(lowered.title))
+    if title_tags is None:
+        title_tags = _scan(lowered.title)
 
     # Check for exclusions first (in title only)
-    for exclusion in GREAT_FIT_EXCLUSIONS:
-        if exclusion in title_lower:
-            return False
+    if not title_words.isdisjoint(GREAT_FIT_EXCLUSION_WORDS) or 'exclusion' in title_tags:
+        return False
 
     # Check for great fit keywords in title
-    for keyword in GREAT_FIT_KEYWORDS:
-        if keyword in title_lower:
-            return True
+    if not title_words.isdisjoint(GREAT_FIT_WORDS) or 'great_fit' in title_tags:
+        return True
 
     # Fallback: check description if title didn't match
-    if description:
-        desc_lower = description.lower()
-        # Only match if strong signal in description AND no exclusions
-        strong_signals = ['data scientist', 'machine learning engineer', 'ml engineer', 'data analyst']
-        for signal in strong_signals:
-            if signal in desc_lower:
-                return True
-
-    return False
+    # Only match if strong signal in description AND no exclusions
+    if desc_tags is None:
+        desc_tags = _scan(lowered.desc)
+    return 'signal' in desc_tags
 
 
 def is_english_posting(title: str, description: str) -> bool:
@@ -193,13 +364,16 @@ def is_english_posting(title: str, description: str) -> bool:
     Filter to English-language postings only.
     Excludes Spanish/Catalan postings.
     """
-    text = f"{title} {description}".lower()
+    return is_english_text(LoweredText.of(title, description))
 
-    # Count non-English indicators
-    non_english_count = 0
-    for pattern in NON_ENGLISH_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            non_english_count += 1
+
+def is_english_text(lowered: LoweredText) -> bool:
+    """is_english_posting for a posting that has already been lowered (NON_ENGLISH_RE assumes lowercase text)."""
+    # Count distinct non-English indicators; each pattern is a single fixed word or phrase,
+    # so distinct matches are distinct patterns (repeats of one word still count once)
+    indicators = set(NON_ENGLISH_RE.findall(lowered.title.translate(ACCENT_FOLD)))
+    indicators.update(NON_ENGLISH_RE.findall(lowered.desc.translate(ACCENT_FOLD)))
+    non_english_count = len(indicators)
 
     # If multiple non-English indicators, likely not English
     return non_english_count < 3
@@ -210,9 +384,93 @@ def detect_visa_mentions(description: str) -> tuple[bool, bool]:
     Returns (mentions_visa, mentions_relocation).
     Searches for: "visa sponsorship", "work permit", "relocation package", etc.
     """
-    text = description.lower()
+    desc_tags = _scan(description.lower())
+    return 'visa' in desc_tags, 'relocation' in desc_tags
+
+
+def classify_posting(lowered: LoweredText) -> tuple[bool, bool, bool, bool]:
+    """
+    Classify a lowered posting in one call.
+    Returns (is_barcelona, is_data_role, mentions_visa, mentions_relocation), the same
+    as is_barcelona_role, is_data_role and detect_visa_mentions on the original fields.
+    Each field is scanned for keywords once.
+    """
+    return _posting_flags(lowered, _scan(lowered.title), _scan(lowered.desc))
+
+
+def classify(lowered: LoweredText) -> dict[str, bool]:
+    """
+    Run every filter on a lowered posting, from one keyword scan per field.
+    Returns {'barcelona', 'data', 'great_fit', 'english', 'visa', 'relocation'} flags:
+    classify_posting's four plus is_great_fit and is_english_posting. Prefer
+    classify_posting when only those four are needed; the extra two cost a
+    title check and a non-English regex pass over the description.
+    """
+    title_tags, desc_tags = _scan(lowered.title), _scan(lowered.desc)
+    is_bcn, is_data, mentions_visa, mentions_relocation = _posting_flags(lowered, title_tags, desc_tags)
+
+    return {
+        'barcelona': is_bcn,
+        'data': is_data,
+        'great_fit': _is_great_fit(lowered, title_tags, desc_tags),
+        'english': is_english_text(lowered),
+        'visa': mentions_visa,
+        'relocation': mentions_relocation,
+    }
+
+
+def _posting_flags(lowered: LoweredText, title_tags: set[str], desc_tags: set[str]) -> tuple[bool, bool, bool, bool]:
+    """classify_posting's flags, given the title and description _scan tags."""
+    tags = title_tags | desc_tags
+
+    return (
+        _matches_barcelona(lowered, tags | _scan(lowered.location)),
+        'data' in tags,
+        'visa' in desc_tags,
+        'relocation' in desc_tags,
+    )
+
+
+def detect_work_type(location: str, description: str) -> tuple[str, str]:
+    """Detect work type from location and description. Returns (type_id, label)."""
+    # The patterns are case-insensitive, so the fields are searched as-is
+    # instead of being lowercased and concatenated into a copy of the description
+    location = location or ''
+    description = description or ''
+    is_hybrid = bool(HYBRID_RE.search(location) or HYBRID_RE.search(description))
+
+    if REMOTE_RE.search(location) or REMOTE_RE.search(description):
+        # Check if it's actually hybrid
+        if is_hybrid:
+            return 'hybrid', 'Hybrid'
+        return 'remote', 'Remote'
+    elif is_hybrid:
+        return 'hybrid', 'Hybrid'
+    else:
+        return 'onsite', 'In-person'
+
+
+def parse_posted_date(text: Optional[str]) -> Optional[str]:
+    """
+    Parse a posted date in any of the POSTED_DATE_RE formats to YYYY-MM-DD.
+    Returns None if the text isn't a valid date in one of those formats.
+    One regex match and a month lookup replace trying strptime per format.
+    """
+    match = POSTED_DATE_RE.fullmatch((text or '').strip())
+    if not match:
+        return None
 
-    mentions_visa = any(kw in text for kw in VISA_KEYWORDS)
-    mentions_relocation = any(kw in text for kw in RELOCATION_KEYWORDS)
+    parts = match.groupdict()
+    if parts['dmy_day']:
+        year, month, day = parts['dmy_year'], MONTHS.get(parts['dmy_month'].lower()), parts['dmy_day']
+    elif parts['mdy_day']:
+        year, month, day = parts['mdy_year'], MONTHS.get(parts['mdy_month'].lower()), parts['mdy_day']
+    else:
+        year, month, day = parts['iso_year'], int(parts['iso_month']), parts['iso_day']
+    if month is None:
+        return None
 
-    return mentions_visa, mentions_relocation
+    try:
+        return date(int(year), month, int(day)).isoformat()
+    except ValueError:  # e.g. Feb 30
+        return None